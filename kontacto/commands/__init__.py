@@ -1,22 +1,26 @@
-from .base_command import BaseCommand
-from .command_registry import CommandRegistry
-from .contact_commands import (
-    AddContactCommand,
-    DeleteContactCommand,
-    EditContactCommand,
-    ListContactsCommand,
-    SearchContactsCommand,
-    UpcomingBirthdaysCommand,
-)
-from .note_commands import (
-    AddNoteCommand,
-    DeleteNoteCommand,
-    EditNoteCommand,
-    ListNotesCommand,
-    SearchByTagCommand,
-    SearchNotesCommand,
-)
-from .tag_commands import AddTagCommand, ListTagsCommand, NotesByTagCommand, RemoveTagCommand
+import importlib
+from typing import Any
+
+_LAZY = {
+    "BaseCommand": "kontacto.commands.base_command",
+    "CommandRegistry": "kontacto.commands.command_registry",
+    "AddContactCommand": "kontacto.commands.contact_commands",
+    "ListContactsCommand": "kontacto.commands.contact_commands",
+    "SearchContactsCommand": "kontacto.commands.contact_commands",
+    "EditContactCommand": "kontacto.commands.contact_commands",
+    "DeleteContactCommand": "kontacto.commands.contact_commands",
+    "UpcomingBirthdaysCommand": "kontacto.commands.contact_commands",
+    "AddNoteCommand": "kontacto.commands.note_commands",
+    "ListNotesCommand": "kontacto.commands.note_commands",
+    "SearchNotesCommand": "kontacto.commands.note_commands",
+    "SearchByTagCommand": "kontacto.commands.note_commands",
+    "EditNoteCommand": "kontacto.commands.note_commands",
+    "DeleteNoteCommand": "kontacto.commands.note_commands",
+    "AddTagCommand": "kontacto.commands.tag_commands",
+    "RemoveTagCommand": "kontacto.commands.tag_commands",
+    "ListTagsCommand": "kontacto.commands.tag_commands",
+    "NotesByTagCommand": "kontacto.commands.tag_commands",
+}
 
 __all__ = [
     "BaseCommand",
@@ -38,3 +42,17 @@ __all__ = [
     "ListTagsCommand",
     "NotesByTagCommand",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import command classes on first access instead of at package import."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,15 @@
+"""Formatting helpers shared by the note and tag commands."""
+
+
+def preview(text: str, limit: int = 60) -> str:
+    """
+    Shorten text for display, marking cut text with an ellipsis.
+
+    Args:
+        text: Text to shorten
+        limit: Maximum number of characters kept
+
+    Returns:
+        The text itself if short enough, otherwise its first limit characters plus "..."
+    """
+    return text if len(text) <= limit else text[:limit] + "..."
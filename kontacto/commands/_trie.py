@@ -0,0 +1,100 @@
+"""Prefix tree used for command name completion and typo suggestions."""
+
+from typing import Any, Optional
+
+# Key marking the end of a word; holds the stored word itself
+_END = None
+
+
+class Trie:
+    """Minimal dict-of-dicts trie over command names and aliases."""
+
+    def __init__(self):
+        """Initialize an empty trie."""
+        self._root: dict[Optional[str], Any] = {}
+
+    def insert(self, word: str) -> None:
+        """
+        Insert a word into the trie.
+
+        Args:
+            word: Word to insert
+        """
+        node = self._root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[_END] = word
+
+    def complete(self, prefix: str) -> list[str]:
+        """
+        Find all words starting with a prefix.
+
+        Args:
+            prefix: Prefix to complete
+
+        Returns:
+            Sorted list of words starting with the prefix
+        """
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+
+        words = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key is _END:
+                    words.append(child)
+                else:
+                    stack.append(child)
+
+        return sorted(words)
+
+    def approx(self, word: str, max_edits: int) -> list[tuple[str, int]]:
+        """
+        Find words within a Levenshtein distance of the given word.
+
+        Subtrees are pruned as soon as every entry of the rolling distance row
+        exceeds max_edits, since no word below them can get closer.
+
+        Args:
+            word: Word to match
+            max_edits: Maximum edit distance
+
+        Returns:
+            List of (word, distance) tuples sorted by distance, then word
+        """
+        results: list[tuple[str, int]] = []
+        first_row = list(range(len(word) + 1))
+
+        for char, child in self._root.items():
+            if char is not _END:
+                self._approx(child, char, word, first_row, max_edits, results)
+
+        results.sort(key=lambda result: (result[1], result[0]))
+        return results
+
+    def _approx(
+        self,
+        node: dict[Optional[str], Any],
+        char: str,
+        word: str,
+        previous_row: list[int],
+        max_edits: int,
+        results: list[tuple[str, int]],
+    ) -> None:
+        """Descend one trie level, extending the Levenshtein row by one character."""
+        row = [previous_row[0] + 1]
+        for i in range(1, len(word) + 1):
+            row.append(min(row[i - 1] + 1, previous_row[i] + 1, previous_row[i - 1] + (word[i - 1] != char)))
+
+        if _END in node and row[-1] <= max_edits:
+            results.append((node[_END], row[-1]))
+
+        if min(row) <= max_edits:
+            for next_char, child in node.items():
+                if next_char is not _END:
+                    self._approx(child, next_char, word, row, max_edits, results)
@@ -1,11 +1,26 @@
 """Base command class for the Command Pattern."""
 
-from abc import ABC, abstractmethod
-from typing import Any
+import functools
+from typing import Any, Optional
 
+from ..ui.console import Console
 
-class BaseCommand(ABC):
-    """Abstract base class for all commands."""
+
+class BaseCommand:
+    """Base class for all commands."""
+
+    __slots__ = (
+        "name",
+        "aliases",
+        "description",
+        "usage",
+        "examples",
+        "_help_cache",
+        "_alias_set",
+        "_match_set",
+        "_alias_suffix",
+        "_separator",
+    )
 
     def __init__(self):
         """Initialize the command."""
@@ -14,8 +29,52 @@ class BaseCommand(ABC):
         self.description: str = ""
         self.usage: str = ""
         self.examples: list[str] = []
+        self._help_cache: Optional[str] = None
+        self._alias_set: frozenset[str] = frozenset()
+        self._match_set: frozenset[str] = frozenset()
+        self._alias_suffix: str = ""
+        self._separator: str = ""
+
+    def __init_subclass__(cls, **kwargs):
+        """Run _finalize() once, after the outermost constructor has set the command metadata."""
+        super().__init_subclass__(**kwargs)
+        if "__init__" not in cls.__dict__:
+            return
+
+        init = cls.__init__
+
+        @functools.wraps(init)
+        def __init__(self, *args, **kw):
+            init(self, *args, **kw)
+            # Subclass constructors chaining through super().__init__() reach this
+            # wrapper too; only the one belonging to the instance's class finalizes.
+            if type(self).__init__ is __init__:
+                self._finalize()
+
+        cls.__init__ = __init__
+
+    def _finalize(self) -> None:
+        """Precompute lookup and display structures derived from the name and aliases."""
+        self._alias_set = frozenset(self.aliases)
+        self._match_set = frozenset((self.name, *self.aliases))
+        self._alias_suffix = f" ({', '.join(self.aliases)})" if self.aliases else ""
+        self._separator = "-" * len(self.name)
+        self._help_cache = None
+
+    @staticmethod
+    def _confirm(message: str, context: dict[str, Any]) -> bool:
+        """
+        Ask for confirmation unless the session was started with --yes.
+
+        Args:
+            message: Confirmation message
+            context: Execution context
+
+        Returns:
+            True if confirmed or confirmations are skipped
+        """
+        return bool(context.get("assume_yes")) or Console.confirm(message)
 
-    @abstractmethod
     def execute(self, args: list[str], context: dict[str, Any]) -> None:
         """
         Execute the command.
@@ -24,7 +83,7 @@ class BaseCommand(ABC):
             args: Command arguments
             context: Execution context containing repositories and utilities
         """
-        pass
+        raise NotImplementedError
 
     def validate_args(self, args: list[str]) -> bool:
         """
@@ -38,6 +97,29 @@ class BaseCommand(ABC):
         """
         return True
 
+    @staticmethod
+    def _rest(args: list[str], start: int = 0) -> str:
+        """
+        Join the arguments from start onward with spaces.
+
+        A single remaining argument is returned as is, without a copy.
+
+        Args:
+            args: Command arguments
+            start: Index of the first argument to include
+
+        Returns:
+            Joined arguments
+        """
+        if len(args) == start + 1:
+            return args[start]
+        return " ".join(args[start:])
+
+    @property
+    def alias_suffix(self) -> str:
+        """Get the aliases formatted for command listings, e.g. " (h, ?)"."""
+        return self._alias_suffix
+
     def get_help(self) -> str:
         """
         Get help text for the command.
@@ -45,10 +127,13 @@ class BaseCommand(ABC):
         Returns:
             Formatted help text
         """
+        if self._help_cache is not None:
+            return self._help_cache
+
         help_text = f"\n{self.name}"
         if self.aliases:
             help_text += f" (aliases: {', '.join(self.aliases)})"
-        help_text += f"\n{'-' * len(self.name)}\n"
+        help_text += f"\n{self._separator}\n"
         help_text += f"{self.description}\n\n"
         help_text += f"Usage: {self.usage}\n"
 
@@ -57,6 +142,7 @@ class BaseCommand(ABC):
             for example in self.examples:
                 help_text += f"  {example}\n"
 
+        self._help_cache = help_text
         return help_text
 
     def matches(self, command_name: str) -> bool:
@@ -69,4 +155,4 @@ class BaseCommand(ABC):
         Returns:
             True if name matches command or aliases
         """
-        return command_name == self.name or command_name in self.aliases
+        return command_name in self._match_set
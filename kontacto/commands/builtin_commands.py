@@ -2,11 +2,19 @@ import os
 import sys
 
 from ..ui.console import Console
-from ..utils.fuzzy_matcher import find_best_match
 from .base_command import BaseCommand
 
+_HELP_SECTIONS = (
+    ("contact", "Contact Commands"),
+    ("note", "Note Commands"),
+    ("tag", "Tag Commands"),
+    ("other", "Other Commands"),
+)
+
 
 class HelpCommand(BaseCommand):
+    __slots__ = ("_error", "_info", "_header")
+
     def __init__(self):
         super().__init__()
         self.name = "help"
@@ -15,72 +23,48 @@ class HelpCommand(BaseCommand):
         self.usage = "help [command]"
         self.examples = ["help", "help add-contact", "? search-notes"]
 
+        # Bound once so execute() avoids repeated module attribute lookups
+        self._error = Console.error
+        self._info = Console.info
+        self._header = Console.header
+
     def execute(self, args, context):
-        kontacto = context["kontacto"]
+        registry = context["kontacto"].command_registry
 
         if args:
             # Show help for specific command
             command_name = args[0]
-            command = kontacto.command_registry.get(command_name)
+            command = registry.get(command_name)
 
             if command:
                 print(command.get_help())
             else:
-                Console.error(f"Unknown command: {command_name}")
-                suggestions = find_best_match(command_name, kontacto.command_registry.get_command_names())
-                if suggestions:
-                    Console.info(f"Did you mean: {suggestions}?")
+                self._error(f"Unknown command: {command_name}")
+                suggestion = registry.suggest(command_name)
+                if suggestion:
+                    self._info(f"Did you mean: {suggestion}?")
         else:
             # Show all commands
-            Console.header("Kontacto - Available Commands")
-
-            commands = kontacto.command_registry.get_all_commands()
-
-            # Group commands by category
-            contact_commands = []
-            note_commands = []
-            tag_commands = []
-            other_commands = []
-
-            for cmd in commands:
-                if "contact" in cmd.name:
-                    contact_commands.append(cmd)
-                elif cmd.name in ["add-tag", "remove-tag", "list-tags", "notes-by-tag", "clean-tags"]:
-                    tag_commands.append(cmd)
-                elif "note" in cmd.name or "tag" in cmd.name:
-                    note_commands.append(cmd)
-                else:
-                    other_commands.append(cmd)
-
-            # Display commands by category
-            if contact_commands:
-                print("\nContact Commands:")
-                for cmd in sorted(contact_commands, key=lambda x: x.name):
-                    aliases = f" ({', '.join(cmd.aliases)})" if cmd.aliases else ""
-                    print(f"  {cmd.name:<20} {cmd.description}{aliases}")
-
-            if note_commands:
-                print("\nNote Commands:")
-                for cmd in sorted(note_commands, key=lambda x: x.name):
-                    aliases = f" ({', '.join(cmd.aliases)})" if cmd.aliases else ""
-                    print(f"  {cmd.name:<20} {cmd.description}{aliases}")
+            self._header("Kontacto - Available Commands")
 
-            if tag_commands:
-                print("\nTag Commands:")
-                for cmd in sorted(tag_commands, key=lambda x: x.name):
-                    aliases = f" ({', '.join(cmd.aliases)})" if cmd.aliases else ""
-                    print(f"  {cmd.name:<20} {cmd.description}{aliases}")
+            categorized = registry.get_categorized()
 
-            if other_commands:
-                print("\nOther Commands:")
-                for cmd in sorted(other_commands, key=lambda x: x.name):
-                    aliases = f" ({', '.join(cmd.aliases)})" if cmd.aliases else ""
-                    print(f"  {cmd.name:<20} {cmd.description}{aliases}")
+            # Display commands by category
+            lines = []
+            for category, title in _HELP_SECTIONS:
+                if categorized[category]:
+                    lines.append(f"\n{title}:")
+                    lines.extend(
+                        f"  {cmd.name:<20} {cmd.description}{cmd.alias_suffix}" for cmd in categorized[category]
+                    )
 
-            print("\nType 'help <command>' for detailed help on a specific command.")
+            lines.append("\nType 'help <command>' for detailed help on a specific command.")
+            print("\n".join(lines))
 
 
 class ExitCommand(BaseCommand):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "exit"
@@ -95,6 +79,8 @@ class ExitCommand(BaseCommand):
 
 
 class ClearCommand(BaseCommand):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "clear"
@@ -104,4 +90,13 @@ class ClearCommand(BaseCommand):
         self.examples = ["clear", "cls"]
 
     def execute(self, args, context):
-        os.system("clear" if os.name == "posix" else "cls")
+        if not sys.stdout.isatty():
+            return
+
+        if os.environ.get("TERM") == "dumb":
+            os.system("clear" if os.name == "posix" else "cls")
+            return
+
+        # Home cursor, clear screen and scrollback without spawning a shell
+        sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+        sys.stdout.flush()
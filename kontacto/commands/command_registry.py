@@ -1,17 +1,51 @@
 """Command registry for managing commands."""
 
-from typing import Optional
+import functools
+import sys
+from types import MappingProxyType
+from typing import Mapping, Optional
 
+from ..utils.fuzzy_matcher import find_best_match
+from ._trie import Trie
 from .base_command import BaseCommand
 
+_TAG_COMMAND_NAMES = frozenset({"add-tag", "remove-tag", "list-tags", "notes-by-tag", "clean-tags"})
+
+
+@functools.lru_cache(maxsize=64)
+def _classify(command_name: str) -> str:
+    """
+    Get the help category for a command name.
+
+    Args:
+        command_name: Command name
+
+    Returns:
+        One of "contact", "note", "tag" or "other"
+    """
+    if command_name.find("contact") != -1:
+        return "contact"
+    if command_name in _TAG_COMMAND_NAMES:
+        return "tag"
+    if command_name.find("note") != -1 or command_name.find("tag") != -1:
+        return "note"
+    return "other"
+
 
 class CommandRegistry:
     """Registry for managing commands."""
 
     def __init__(self):
         """Initialize the command registry."""
-        self._commands: dict[str, BaseCommand] = {}
-        self._aliases: dict[str, str] = {}
+        # Command names and aliases mapped to their commands
+        self._lookup: dict[str, BaseCommand] = {}
+        # Command names and aliases mapped to canonical command names
+        self._alias_map: dict[str, str] = {}
+        self._alias_view: Mapping[str, str] = MappingProxyType(self._alias_map)
+        self._all_cache: tuple[BaseCommand, ...] = ()
+        self._names_tuple: tuple[str, ...] = ()
+        self._trie = Trie()
+        self._categorized_cache: Optional[dict[str, list[BaseCommand]]] = None
 
     def register(self, command: BaseCommand) -> None:
         """
@@ -23,16 +57,26 @@ class CommandRegistry:
         Raises:
             ValueError: If command name or alias already exists
         """
-        if command.name in self._commands:
+        if command.name in self._lookup:
             raise ValueError(f"Command '{command.name}' already registered")
-
-        self._commands[command.name] = command
-
-        # Register aliases
+        seen = {command.name}
         for alias in command.aliases:
-            if alias in self._aliases:
+            if alias in self._lookup or alias in seen:
                 raise ValueError(f"Alias '{alias}' already registered")
-            self._aliases[alias] = command.name
+            seen.add(alias)
+
+        # Interned keys let dispatch lookups of interned input short-circuit on identity
+        command.name = sys.intern(command.name)
+        command.aliases = [sys.intern(alias) for alias in command.aliases]
+
+        for key in (command.name, *command.aliases):
+            self._lookup[key] = command
+            self._alias_map[key] = command.name
+            self._trie.insert(key)
+
+        self._all_cache += (command,)
+        self._names_tuple = tuple(sorted(self._lookup))
+        self._categorized_cache = None
 
     def get(self, command_name: str) -> Optional[BaseCommand]:
         """
@@ -44,28 +88,94 @@ class CommandRegistry:
         Returns:
             Command if found, None otherwise
         """
-        # Check if it's an alias
-        if command_name in self._aliases:
-            command_name = self._aliases[command_name]
+        return self._lookup.get(command_name)
 
-        return self._commands.get(command_name)
+    def get_alias_map(self) -> Mapping[str, str]:
+        """
+        Get the mapping used to resolve typed command words.
 
-    def get_all_commands(self) -> list[BaseCommand]:
+        Returns:
+            Read-only live view mapping every command name and alias to its command name
+        """
+        return self._alias_view
+
+    def get_all_commands(self) -> tuple[BaseCommand, ...]:
         """
         Get all registered commands.
 
         Returns:
-            List of all commands
+            Tuple of all commands in registration order
         """
-        return list(self._commands.values())
+        return self._all_cache
 
-    def get_command_names(self) -> list[str]:
+    def get_command_names(self) -> tuple[str, ...]:
         """
         Get all command names and aliases.
 
         Returns:
-            List of command names and aliases
+            Sorted tuple of command names and aliases
+        """
+        return self._names_tuple
+
+    def complete(self, prefix: str) -> list[str]:
+        """
+        Get command names and aliases starting with a prefix.
+
+        Args:
+            prefix: Typed prefix
+
+        Returns:
+            Sorted list of matching names and aliases
+        """
+        return self._trie.complete(prefix)
+
+    def approx(self, command_name: str, max_edits: int) -> list[str]:
         """
-        names = list(self._commands.keys())
-        names.extend(self._aliases.keys())
-        return sorted(names)
+        Get command names and aliases within an edit distance of a name.
+
+        Args:
+            command_name: Possibly misspelled command name
+            max_edits: Maximum Levenshtein distance
+
+        Returns:
+            Matching names and aliases, closest first
+        """
+        return [name for name, _ in self._trie.approx(command_name, max_edits)]
+
+    def suggest(self, command_name: str) -> Optional[str]:
+        """
+        Suggest a command name or alias for a mistyped command.
+
+        Names within two edits are preferred; otherwise the closest fuzzy match is used.
+
+        Args:
+            command_name: Possibly misspelled command name
+
+        Returns:
+            Suggested name or alias, or None if nothing is close enough
+        """
+        close = self.approx(command_name.lower(), 2)
+        if close:
+            return close[0]
+        return find_best_match(command_name, self._names_tuple)
+
+    def get_categorized(self) -> dict[str, list[BaseCommand]]:
+        """
+        Get commands grouped by category for help output.
+
+        Returns:
+            Mapping of "contact", "note", "tag" and "other" to commands sorted by name,
+            cached until the next registration
+        """
+        if self._categorized_cache is None:
+            categorized: dict[str, list[BaseCommand]] = {"contact": [], "note": [], "tag": [], "other": []}
+
+            for command in self._all_cache:
+                categorized[_classify(command.name)].append(command)
+
+            for commands in categorized.values():
+                commands.sort(key=lambda command: command.name)
+
+            self._categorized_cache = categorized
+
+        return self._categorized_cache
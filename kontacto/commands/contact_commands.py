@@ -1,18 +1,76 @@
-from datetime import datetime
+import functools
+import itertools
 from typing import Any
 
-from tabulate import tabulate
-
 from ..commands.base_command import BaseCommand
 from ..models.contact import Contact
 from ..repositories.contact_repository import ContactRepository
 from ..ui.console import Console
-from ..utils.validators import ValidationError, parse_date
+from ..ui.table import render_grid
+from ..utils.validators import ValidationError, parse_date, parse_dmy_date, validate_email, validate_phone
+
+# Number of contacts shown per list-contacts page by default
+DEFAULT_PAGE_SIZE = 50
+
+# Table headers for the list, search and birthdays commands
+_LIST_HEADERS = ("Name", "Address", "Phones", "Emails", "Birthday")
+_SEARCH_HEADERS = _LIST_HEADERS[:4]
+_BIRTHDAY_HEADERS = ("Name", "Birthday", "Days Until")
+
+# Placeholders shown by the edit screens for empty fields
+_NONE = "None"
+_NOT_SET = "Not set"
+
+
+@functools.lru_cache(maxsize=None)
+def _flag_parser() -> Any:
+    """Build the parser for add-contact flags on first use."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="add-contact", add_help=False, allow_abbrev=False, exit_on_error=False)
+    parser.add_argument("--address", "--addr", dest="address", default="")
+    parser.add_argument("--email", dest="emails", action="append", default=None)
+    parser.add_argument("--phone", dest="phones", action="append", default=None)
+    parser.add_argument("--birthday", "--bday", "--bd", dest="birthday", default=None)
+    return parser
+
+
+def _parse_flag_args(args: list[str]) -> tuple[dict[str, Any], list[str]]:
+    """
+    Parse add-contact flags.
+
+    Args:
+        args: Arguments following the contact name
+
+    Returns:
+        Tuple of the parsed flag values by name and the unrecognized arguments
+
+    Raises:
+        ValueError: If a flag is given without a value; the message is the flag name
+    """
+    # The token after a spaced flag is always its value, even if it starts with a
+    # dash, so every flag reaches argparse in --flag=value form
+    tokens = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg.startswith("--") and "=" not in arg:
+            if i + 1 >= len(args):
+                raise ValueError(arg)
+            arg = f"{arg}={args[i + 1]}"
+            i += 1
+        tokens.append(arg)
+        i += 1
+
+    namespace, extras = _flag_parser().parse_known_args(tokens)
+    return vars(namespace), extras
 
 
 class AddContactCommand(BaseCommand):
     """Command to add a new contact."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "add-contact"
@@ -61,100 +119,123 @@ class AddContactCommand(BaseCommand):
 
     def _parse_flags(self, args: list[str]) -> dict[str, Any] | None:
         """Parse command line flags into a dictionary of values."""
-        result = {"address": "", "emails": [], "phones": [], "birthday": None}
-
-        # Flag aliases
-        aliases = {"addr": "address", "bday": "birthday", "bd": "birthday"}
-
-        i = 0
-        while i < len(args):
-            arg = args[i]
+        try:
+            flags, extras = _parse_flag_args(args)
+        except ValueError as e:
+            Console.error(f"Flag {e} requires a value")
+            Console.info(self.usage)
+            return None
 
-            if not arg.startswith("--"):
+        for arg in extras:
+            if arg.startswith("--"):
+                Console.error(f"Unknown flag: {arg.split('=', 1)[0]}")
+                Console.info("Supported flags: --address, --email, --phone, --birthday")
+                Console.info("Short aliases: --addr, --bday, --bd")
+            else:
                 Console.error(f"Invalid argument: {arg}")
                 Console.info("All arguments after name must be flags starting with --")
                 Console.info(self.usage)
-                return None
-
-            # Parse flag
-            if "=" in arg:
-                # Format: --flag=value
-                flag_part, value = arg[2:].split("=", 1)
-                i += 1
-            else:
-                # Format: --flag value
-                flag_part = arg[2:]
-                if i + 1 >= len(args):
-                    Console.error(f"Flag --{flag_part} requires a value")
-                    Console.info(self.usage)
-                    return None
-                value = args[i + 1]
-                i += 2
+            return None
 
-            # Resolve aliases
-            flag_name = aliases.get(flag_part, flag_part)
-
-            # Process flag value
-            if flag_name == "address":
-                result["address"] = value.strip()
-            elif flag_name == "email":
-                result["emails"].append(value.strip())
-            elif flag_name == "phone":
-                result["phones"].append(value.strip())
-            elif flag_name == "birthday":
-                try:
-                    result["birthday"] = datetime.strptime(value.strip(), "%d.%m.%Y").date()
-                except ValueError:
-                    Console.error(f"Invalid birthday format: {value}")
-                    Console.info("Birthday must be in DD.MM.YYYY format")
-                    return None
-            else:
-                Console.error(f"Unknown flag: --{flag_part}")
-                Console.info("Supported flags: --address, --email, --phone, --birthday")
-                Console.info("Short aliases: --addr, --bday, --bd")
+        birthday = None
+        birthday_flag = flags["birthday"]
+        if birthday_flag is not None:
+            try:
+                birthday = parse_dmy_date(birthday_flag.strip())
+            except ValueError:
+                Console.error(f"Invalid birthday format: {birthday_flag}")
+                Console.info("Birthday must be in DD.MM.YYYY format")
                 return None
 
-        return result
+        return {
+            "address": flags["address"].strip(),
+            "emails": [email.strip() for email in flags["emails"] or []],
+            "phones": [phone.strip() for phone in flags["phones"] or []],
+            "birthday": birthday,
+        }
 
 
 class ListContactsCommand(BaseCommand):
     """Command to list all contacts."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "list-contacts"
         self.aliases = ["lc", "contacts"]
-        self.description = "List all contacts"
-        self.usage = "list-contacts"
-        self.examples = ["list-contacts", "lc"]
+        self.description = "List all contacts, one page at a time"
+        self.usage = "list-contacts [--page=<n>] [--limit=<n>]"
+        self.examples = ["list-contacts", "lc --page=2", "lc --limit=100"]
 
     def execute(self, args: list[str], context: dict[str, Any]) -> None:
+        paging = self._parse_paging(args)
+        if paging is None:
+            return  # Error already displayed
+        page, limit = paging
+
         repo: ContactRepository = context["contact_repo"]
-        contacts = repo.get_all()
+        total = repo.count()
 
-        if not contacts:
+        if not total:
             Console.info("No contacts found")
             return
 
-        # Prepare data for table
-        table_data = []
-        for contact in contacts:
-            phones = ", ".join(contact.phones) if contact.phones else "N/A"
-            emails = ", ".join(contact.emails) if contact.emails else "N/A"
-            birthday = contact.birthday.strftime("%Y-%m-%d") if contact.birthday else "N/A"
+        start = (page - 1) * limit
+        if start >= total:
+            Console.error(f"Page {page} is empty (total contacts: {total})")
+            return
+        end = min(start + limit, total)
+
+        rows = map(Contact.table_row, itertools.islice(repo.iter_all(), start, end))
+        table = render_grid(_LIST_HEADERS, rows)
+
+        Console.info_block(f"\nTotal contacts: {total}", table)
+
+        if end < total:
+            Console.info(f"Showing {start + 1}-{end} of {total} — use --page={page + 1} for more")
+
+    def _parse_paging(self, args: list[str]) -> tuple[int, int] | None:
+        """Parse --page and --limit flags into a (page, limit) pair."""
+        values = {"page": 1, "limit": DEFAULT_PAGE_SIZE}
+
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if "=" in arg:
+                flag, value = arg.split("=", 1)
+                i += 1
+            elif i + 1 < len(args):
+                flag, value = arg, args[i + 1]
+                i += 2
+            else:
+                flag, value = arg, ""
+                i += 1
+
+            if flag not in ("--page", "--limit"):
+                Console.error(f"Unknown argument: {arg}")
+                Console.info(self.usage)
+                return None
 
-            table_data.append([contact.name, contact.address or "N/A", phones, emails, birthday])
+            try:
+                number = int(value)
+            except ValueError:
+                number = 0
+            if number < 1:
+                Console.error(f"{flag} requires a positive number")
+                Console.info(self.usage)
+                return None
 
-        headers = ["Name", "Address", "Phones", "Emails", "Birthday"]
-        table = tabulate(table_data, headers=headers, tablefmt="grid")
+            values[flag[2:]] = number
 
-        Console.info(f"\nTotal contacts: {len(contacts)}")
-        print(table)
+        return values["page"], values["limit"]
 
 
 class SearchContactsCommand(BaseCommand):
     """Command to search contacts."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "search-contacts"
@@ -169,7 +250,7 @@ class SearchContactsCommand(BaseCommand):
             Console.info(self.usage)
             return
 
-        query = " ".join(args)
+        query = self._rest(args)
         repo: ContactRepository = context["contact_repo"]
         contacts = repo.search(query)
 
@@ -178,21 +259,25 @@ class SearchContactsCommand(BaseCommand):
             return
 
         # Display results
-        table_data = []
-        for contact in contacts:
-            phones = ", ".join(contact.phones) if contact.phones else "N/A"
-            emails = ", ".join(contact.emails) if contact.emails else "N/A"
+        rows = (row[:4] for row in map(Contact.table_row, contacts))
+        table = render_grid(_SEARCH_HEADERS, rows)
 
-            table_data.append([contact.name, contact.address or "N/A", phones, emails])
-
-        headers = ["Name", "Address", "Phones", "Emails"]
-        table = tabulate(table_data, headers=headers, tablefmt="grid")
-
-        Console.info(f"\nFound {len(contacts)} contact(s) matching '{query}':")
-        print(table)
+        Console.info_block(f"\nFound {len(contacts)} contact(s) matching '{query}':", table)
 
 
 class EditContactCommand(BaseCommand):
+    __slots__ = ()
+
+    # Direct-mode fields that map onto a single Contact setter or method
+    _FIELD_HANDLERS = {
+        "name": Contact.name.fset,
+        "address": Contact.address.fset,
+        "add-phone": Contact.add_phone,
+        "remove-phone": Contact.remove_phone,
+        "add-email": Contact.add_email,
+        "remove-email": Contact.remove_email,
+    }
+
     def __init__(self):
         super().__init__()
         self.name = "edit-contact"
@@ -229,6 +314,8 @@ class EditContactCommand(BaseCommand):
 
     def _find_contact(self, name: str, repo: ContactRepository):
         """Find contact with fuzzy matching."""
+        info, error, prompt = Console.info, Console.error, Console.prompt
+
         # Try exact match first
         contact = repo.get_by_name(name)
         if contact:
@@ -237,263 +324,277 @@ class EditContactCommand(BaseCommand):
         # Try fuzzy search
         matching_contacts = repo.search(name)
         if not matching_contacts:
-            Console.error(f"No contacts found matching '{name}'")
+            error(f"No contacts found matching '{name}'")
             return None
 
         if len(matching_contacts) == 1:
             contact = matching_contacts[0]
-            Console.info(f"Found contact: {contact.name}")
+            info(f"Found contact: {contact.name}")
             return contact
 
         # Multiple matches - let user choose
-        Console.info(f"Found {len(matching_contacts)} contacts matching '{name}':")
+        info(f"Found {len(matching_contacts)} contacts matching '{name}':")
         for i, contact in enumerate(matching_contacts, 1):
-            phones = ", ".join(contact.phones) if contact.phones else "No phones"
-            emails = ", ".join(contact.emails) if contact.emails else "No emails"
+            phones = contact.phones_str or "No phones"
+            emails = contact.emails_str or "No emails"
             print(f"  {i}. {contact.name} - {phones} - {emails}")
 
         try:
-            choice = int(Console.prompt("Select contact number (0 to cancel)"))
+            choice = int(prompt("Select contact number (0 to cancel)"))
             if choice == 0:
-                Console.info("Edit cancelled")
+                info("Edit cancelled")
                 return None
             if 1 <= choice <= len(matching_contacts):
                 return matching_contacts[choice - 1]
             else:
-                Console.error("Invalid selection")
+                error("Invalid selection")
                 return None
         except ValueError:
-            Console.error("Invalid input")
+            error("Invalid input")
             return None
 
     def _interactive_edit(self, contact, repo: ContactRepository):
         """Interactive editing mode."""
-        Console.info(f"\n📝 Editing contact: {contact.name}")
-        Console.info("=" * 40)
+        info, error, prompt = Console.info, Console.error, Console.prompt
 
-        self._display_contact_info(contact)
+        while True:
+            info(f"\n📝 Editing contact: {contact.name}")
+            info("=" * 40)
 
-        # Show edit options
-        Console.info("\n🔧 What would you like to edit?")
-        options = [
-            ("Name", f"Current: {contact.name}"),
-            ("Address", f"Current: {contact.address or 'Not set'}"),
-            ("Birthday", f"Current: {contact.birthday or 'Not set'}"),
-            ("Add Phone", f"Current phones: {', '.join(contact.phones) if contact.phones else 'None'}"),
-            ("Remove Phone", f"Current phones: {', '.join(contact.phones) if contact.phones else 'None'}"),
-            ("Add Email", f"Current emails: {', '.join(contact.emails) if contact.emails else 'None'}"),
-            ("Remove Email", f"Current emails: {', '.join(contact.emails) if contact.emails else 'None'}"),
-        ]
+            self._display_contact_info(contact)
 
-        for i, (option, current) in enumerate(options, 1):
-            print(f"  {i}. {option:<12} - {current}")
+            # Show edit options
+            info("\n🔧 What would you like to edit?")
+            options = self._build_edit_options(contact)
+
+            for i, (option, current) in enumerate(options, 1):
+                print(f"  {i}. {option:<12} - {current}")
+
+            try:
+                choice = int(prompt("\nSelect option (0 to cancel)"))
+            except ValueError:
+                error("Invalid input")
+                return
 
-        try:
-            choice = int(Console.prompt("\nSelect option (0 to cancel)"))
             if choice == 0:
-                Console.info("Edit cancelled")
+                info("Edit cancelled")
                 return
             if not (1 <= choice <= len(options)):
-                Console.error("Invalid selection")
+                error("Invalid selection")
                 return
 
-            self._handle_field_edit(contact, choice, repo)
+            if not self._handle_field_edit(contact, choice, repo):
+                return
 
-        except ValueError:
-            Console.error("Invalid input")
-            return
+    @staticmethod
+    def _build_edit_options(contact) -> tuple[tuple[str, str], ...]:
+        """Build the (option, current value) pairs shown by the interactive edit menu."""
+        phones = f"Current phones: {contact.phones_str or _NONE}"
+        emails = f"Current emails: {contact.emails_str or _NONE}"
+        return (
+            ("Name", f"Current: {contact.name}"),
+            ("Address", f"Current: {contact.address or _NOT_SET}"),
+            ("Birthday", f"Current: {contact.birthday_str or _NOT_SET}"),
+            ("Add Phone", phones),
+            ("Remove Phone", phones),
+            ("Add Email", emails),
+            ("Remove Email", emails),
+        )
 
     def _display_contact_info(self, contact):
         """Display current contact information."""
         print("\n📋 Contact Information:")
         print(f"   Name: {contact.name}")
-        print(f"   Address: {contact.address or 'Not set'}")
-        print(f"   Birthday: {contact.birthday or 'Not set'}")
-        print(f"   Phones: {', '.join(contact.phones) if contact.phones else 'None'}")
-        print(f"   Emails: {', '.join(contact.emails) if contact.emails else 'None'}")
-
-    def _handle_field_edit(self, contact, choice: int, repo: ContactRepository):
-        """Handle editing a specific field."""
+        print(f"   Address: {contact.address or _NOT_SET}")
+        print(f"   Birthday: {contact.birthday_str or _NOT_SET}")
+        print(f"   Phones: {contact.phones_str or _NONE}")
+        print(f"   Emails: {contact.emails_str or _NONE}")
+
+    def _handle_field_edit(self, contact, choice: int, repo: ContactRepository) -> bool:
+        """Handle editing a specific field; return True if the user wants another change."""
+        info, error, success, prompt = Console.info, Console.error, Console.success, Console.prompt
         original_name = contact.name
 
         try:
             if choice == 1:  # Name
-                new_name = Console.prompt("Enter new name")
+                new_name = prompt("Enter new name")
                 if new_name.strip():
                     contact.name = new_name.strip()
-                    Console.success(f"Name updated: {original_name} → {contact.name}")
+                    success(f"Name updated: {original_name} → {contact.name}")
                 else:
-                    Console.error("Name cannot be empty")
-                    return
+                    error("Name cannot be empty")
+                    return False
 
             elif choice == 2:  # Address
-                new_address = Console.prompt("Enter new address (or leave empty to clear)")
+                new_address = prompt("Enter new address (or leave empty to clear)")
                 contact.address = new_address.strip()
-                Console.success(f"Address updated to: {contact.address or 'Cleared'}")
+                success(f"Address updated to: {contact.address or 'Cleared'}")
 
             elif choice == 3:  # Birthday
-                birthday_str = Console.prompt("Enter birthday (YYYY-MM-DD, DD/MM/YYYY, etc.)")
+                birthday_str = prompt("Enter birthday (YYYY-MM-DD, DD/MM/YYYY, etc.)")
                 if birthday_str.strip():
                     birthday = parse_date(birthday_str.strip())
                     if birthday:
                         contact.birthday = birthday
-                        Console.success(f"Birthday updated to: {contact.birthday}")
+                        success(f"Birthday updated to: {contact.birthday}")
                     else:
-                        Console.error("Invalid date format. Please use YYYY-MM-DD, DD/MM/YYYY, etc.")
-                        return
+                        error("Invalid date format. Please use YYYY-MM-DD, DD/MM/YYYY, etc.")
+                        return False
                 else:
                     contact.birthday = None
-                    Console.success("Birthday cleared")
+                    success("Birthday cleared")
 
             elif choice == 4:  # Add Phone
-                phone = Console.prompt("Enter phone number to add")
+                phone = prompt("Enter phone number to add")
                 if phone.strip():
                     contact.add_phone(phone.strip())
-                    Console.success(f"Phone added: {phone}")
+                    success(f"Phone added: {phone}")
                 else:
-                    Console.error("Phone number cannot be empty")
-                    return
+                    error("Phone number cannot be empty")
+                    return False
 
             elif choice == 5:  # Remove Phone
                 if not contact.phones:
-                    Console.error("No phones to remove")
-                    return
+                    error("No phones to remove")
+                    return False
 
-                Console.info("Current phones:")
+                info("Current phones:")
                 for i, phone in enumerate(contact.phones, 1):
                     print(f"  {i}. {phone}")
 
                 try:
-                    phone_choice = int(Console.prompt("Select phone number to remove (0 to cancel)"))
+                    phone_choice = int(prompt("Select phone number to remove (0 to cancel)"))
                     if phone_choice == 0:
-                        Console.info("Remove cancelled")
-                        return
+                        info("Remove cancelled")
+                        return False
                     if 1 <= phone_choice <= len(contact.phones):
                         removed_phone = contact.phones[phone_choice - 1]
                         contact.remove_phone(removed_phone)
-                        Console.success(f"Phone removed: {removed_phone}")
+                        success(f"Phone removed: {removed_phone}")
                     else:
-                        Console.error("Invalid selection")
-                        return
+                        error("Invalid selection")
+                        return False
                 except ValueError:
-                    Console.error("Invalid input")
-                    return
+                    error("Invalid input")
+                    return False
 
             elif choice == 6:  # Add Email
-                email = Console.prompt("Enter email address to add")
+                email = prompt("Enter email address to add")
                 if email.strip():
                     contact.add_email(email.strip())
-                    Console.success(f"Email added: {email}")
+                    success(f"Email added: {email}")
                 else:
-                    Console.error("Email address cannot be empty")
-                    return
+                    error("Email address cannot be empty")
+                    return False
 
             elif choice == 7:  # Remove Email
                 if not contact.emails:
-                    Console.error("No emails to remove")
-                    return
+                    error("No emails to remove")
+                    return False
 
-                Console.info("Current emails:")
+                info("Current emails:")
                 for i, email in enumerate(contact.emails, 1):
                     print(f"  {i}. {email}")
 
                 try:
-                    email_choice = int(Console.prompt("Select email to remove (0 to cancel)"))
+                    email_choice = int(prompt("Select email to remove (0 to cancel)"))
                     if email_choice == 0:
-                        Console.info("Remove cancelled")
-                        return
+                        info("Remove cancelled")
+                        return False
                     if 1 <= email_choice <= len(contact.emails):
                         removed_email = contact.emails[email_choice - 1]
                         contact.remove_email(removed_email)
-                        Console.success(f"Email removed: {removed_email}")
+                        success(f"Email removed: {removed_email}")
                     else:
-                        Console.error("Invalid selection")
-                        return
+                        error("Invalid selection")
+                        return False
                 except ValueError:
-                    Console.error("Invalid input")
-                    return
+                    error("Invalid input")
+                    return False
 
             # Save the changes
             repo.update(contact)
-            Console.success(f"\n✅ Contact '{contact.name}' updated successfully!")
+            success(f"\n✅ Contact '{contact.name}' updated successfully!")
 
             # Ask if user wants to make more changes
-            more_changes = Console.prompt("\nMake another change? (y/n)").lower()
-            if more_changes in ["y", "yes"]:
-                self._interactive_edit(contact, repo)
+            more_changes = prompt("\nMake another change? (y/n)").lower()
+            return more_changes in ("y", "yes")
 
         except ValidationError as e:
-            Console.error(f"Validation error: {str(e)}")
+            error(f"Validation error: {str(e)}")
+            repo.refresh(contact)
         except Exception as e:
-            Console.error(f"Failed to update contact: {str(e)}")
+            error(f"Failed to update contact: {str(e)}")
+            repo.refresh(contact)
+
+        return False
 
     def _direct_edit(self, contact, args: list[str], repo: ContactRepository):
         """Direct editing mode (backward compatibility)."""
+        info, error, success = Console.info, Console.error, Console.success
+
         if len(args) < 2:
-            Console.error("Field and value are required for direct mode")
-            Console.info("💡 Tip: Use 'edit-contact <name>' for interactive mode")
+            error("Field and value are required for direct mode")
+            info("💡 Tip: Use 'edit-contact <name>' for interactive mode")
             return
 
         field = args[0].lower()
-        value = " ".join(args[1:])
+        value = self._rest(args, 1)
         original_name = contact.name
 
         try:
-            if field == "name":
-                contact.name = value
-            elif field == "address":
-                contact.address = value
+            handler = self._FIELD_HANDLERS.get(field)
+            if handler is not None:
+                handler(contact, value)
             elif field == "birthday":
                 birthday = parse_date(value)
                 if birthday:
                     contact.birthday = birthday
                 else:
-                    Console.error("Invalid date format. Use YYYY-MM-DD")
+                    error("Invalid date format. Use YYYY-MM-DD")
                     return
-            elif field == "add-phone":
-                contact.add_phone(value)
-            elif field == "remove-phone":
-                contact.remove_phone(value)
             elif field == "replace-phone":
                 old_new = value.split()
                 if len(old_new) != 2:
-                    Console.error("Usage: replace-phone '<old>' '<new>'")
+                    error("Usage: replace-phone '<old>' '<new>'")
                     return
                 old_phone, new_phone = old_new
+                validate_phone(new_phone)
                 contact.remove_phone(old_phone)
                 contact.add_phone(new_phone)
-            elif field == "add-email":
-                contact.add_email(value)
-            elif field == "remove-email":
-                contact.remove_email(value)
             elif field == "replace-email":
                 old_new = value.split()
                 if len(old_new) != 2:
-                    Console.error("Usage: replace-email '<old>' '<new>'")
+                    error("Usage: replace-email '<old>' '<new>'")
                     return
                 old_email, new_email = old_new
+                validate_email(new_email)
                 contact.remove_email(old_email)
                 contact.add_email(new_email)
             else:
-                Console.error(f"Unknown field: {field}")
-                Console.info(
+                error(f"Unknown field: {field}")
+                info(
                     "Available fields: name, address, birthday, add-phone, remove-phone, replace-phone, add-email, remove-email, replace-email"
                 )
-                Console.info("💡 Tip: Use 'edit-contact <name>' for interactive mode")
+                info("💡 Tip: Use 'edit-contact <name>' for interactive mode")
                 return
 
             repo.update(contact)
-            Console.success(f"Contact '{original_name}' updated successfully!")
+            success(f"Contact '{original_name}' updated successfully!")
 
         except ValidationError as e:
-            Console.error(f"Validation error: {str(e)}")
+            error(f"Validation error: {str(e)}")
+            repo.refresh(contact)
         except Exception as e:
-            Console.error(f"Failed to update contact: {str(e)}")
+            error(f"Failed to update contact: {str(e)}")
+            repo.refresh(contact)
 
 
 class DeleteContactCommand(BaseCommand):
     """Command to delete a contact."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "delete-contact"
@@ -508,7 +609,7 @@ class DeleteContactCommand(BaseCommand):
             Console.info(self.usage)
             return
 
-        name = " ".join(args)
+        name = self._rest(args)
         repo: ContactRepository = context["contact_repo"]
         contact = repo.get_by_name(name)
 
@@ -526,6 +627,8 @@ class DeleteContactCommand(BaseCommand):
 class UpcomingBirthdaysCommand(BaseCommand):
     """Command to show upcoming birthdays."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "birthdays"
@@ -550,40 +653,24 @@ class UpcomingBirthdaysCommand(BaseCommand):
             return
 
         repo: ContactRepository = context["contact_repo"]
-        contacts = []
-
-        # We iterate over all contacts and select only those whose birthday is in N days
-        for contact in repo.get_all():
-            days_left = contact.days_until_birthday()
-            if days_left is not None and 0 <= days_left <= days:
-                contacts.append((contact, days_left))
+        contacts = repo.get_upcoming_birthdays_with_days(days)
 
         if not contacts:
             Console.info(f"No contacts with birthdays in the next {days} day(s).")
             return
 
         # Prepare data for table
-        table_data = []
-        for contact, days_left in contacts:
-            birthday_str = contact.birthday.strftime("%Y-%m-%d") if contact.birthday else "N/A"
-            table_data.append(
-                [
-                    contact.name,
-                    birthday_str,
-                    f"{days_left} days",
-                ]
-            )
-
-        headers = ["Name", "Birthday", "Days Until"]
-        table = tabulate(table_data, headers=headers, tablefmt="grid")
+        rows = ((contact.name, contact.birthday_str, f"{days_left} days") for contact, days_left in contacts)
+        table = render_grid(_BIRTHDAY_HEADERS, rows)
 
-        Console.info(f"\nBirthdays in the next {days} days:")
-        print(table)
+        Console.info_block(f"\nBirthdays in the next {days} days:", table)
 
 
 class CleanContactsCommand(BaseCommand):
     """Command to delete all contacts from the repository."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "clean-contacts"
@@ -594,18 +681,14 @@ class CleanContactsCommand(BaseCommand):
 
     def execute(self, args: list[str], context: dict[str, Any]) -> None:
         repo: ContactRepository = context["contact_repo"]
-        contacts = repo.get_all()
-        if not contacts:
+        if not repo.count():
             Console.info("No contacts to delete.")
             return
-        if not Console.confirm("Are you sure you want to delete ALL contacts? This cannot be undone."):
+        if not self._confirm("Are you sure you want to delete ALL contacts? This cannot be undone.", context):
             Console.info("Operation cancelled.")
             return
         try:
-            repo._notes.clear() if hasattr(repo, "_notes") else None
-            repo._contacts.clear() if hasattr(repo, "_contacts") else None
-            if hasattr(repo, "save_data"):
-                repo.save_data([])
+            repo.clear()
             Console.success("All contacts deleted successfully!")
         except Exception as e:
             Console.error(f"Failed to delete all contacts: {str(e)}")
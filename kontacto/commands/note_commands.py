@@ -1,18 +1,80 @@
 """Note-related commands for the Personal Assistant."""
 
-from typing import Any
-
-from tabulate import tabulate
+import itertools
+from typing import Any, Optional
 
 from ..commands.base_command import BaseCommand
 from ..models.note import Note
 from ..repositories.note_repository import NoteRepository
 from ..ui.console import Console
+from ..ui.table import render_grid
+from ._display import preview
+
+# Maximum number of rows shown by list-notes and search-notes
+LIST_LIMIT = 100
+SEARCH_LIMIT = 200
+# Maximum number of matches offered when edit-note or delete-note must pick one
+PICK_LIMIT = 5
+
+# Table headers for the list, search and tag search commands
+_LIST_HEADERS = ("Content", "Tags", "Created")
+_SEARCH_HEADERS = ("Content", "Tags")
+_TAG_SEARCH_HEADERS = ("Content", "All Tags")
+
+
+def _list_row(note: Note) -> tuple[str, str, str]:
+    """Build a list-notes table row: content preview, tags and creation time."""
+    return preview(note.content), note.tags_str or "N/A", note.created_str
+
+
+def _resolve_one_note(repo: NoteRepository, query: str, verb: str) -> Optional[Note]:
+    """
+    Search notes and let the user pick one when several match.
+
+    Args:
+        repo: Note repository
+        query: Search query
+        verb: Action named in the selection prompt
+
+    Returns:
+        The chosen note, or None if nothing matched or the user cancelled
+    """
+    # One extra match tells whether there are more than can be picked from
+    notes = repo.search(query, limit=PICK_LIMIT + 1)
+
+    if not notes:
+        Console.error(f"No notes found matching '{query}'")
+        return None
+
+    if len(notes) == 1:
+        return notes[0]
+
+    if len(notes) > PICK_LIMIT:
+        Console.warning(f"Found more than {PICK_LIMIT} notes matching '{query}'")
+        notes = notes[:PICK_LIMIT]
+    else:
+        Console.warning(f"Found {len(notes)} notes matching '{query}'")
+    choices = "\n".join(f"{i}. {preview(note.content)}" for i, note in enumerate(notes, 1))
+    Console.info_block(f"Showing first {PICK_LIMIT} matches:", choices)
+
+    try:
+        choice = int(Console.prompt(f"Select note number to {verb} (0 to cancel)"))
+    except ValueError:
+        Console.error("Invalid input")
+        return None
+    if choice == 0:
+        return None
+    if choice < 1 or choice > len(notes):
+        Console.error("Invalid selection")
+        return None
+    return notes[choice - 1]
 
 
 class AddNoteCommand(BaseCommand):
     """Command to add a new note."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "add-note"
@@ -31,14 +93,14 @@ class AddNoteCommand(BaseCommand):
             return
 
         content = args[0]
-        tags = args[1:] if len(args) > 1 else []
+        tags = args[1:]
 
         note = Note(content=content, tags=tags)
         repo: NoteRepository = context["note_repo"]
 
         try:
             repo.add(note)
-            Console.success(f"Note added successfully with {len(tags)} tag(s)!")
+            Console.success(f"Note added successfully with {len(note.tags)} tag(s)!")
         except Exception as e:
             Console.error(f"Failed to add note: {str(e)}")
 
@@ -46,6 +108,8 @@ class AddNoteCommand(BaseCommand):
 class ListNotesCommand(BaseCommand):
     """Command to list all notes."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "list-notes"
@@ -56,31 +120,26 @@ class ListNotesCommand(BaseCommand):
 
     def execute(self, args: list[str], context: dict[str, Any]) -> None:
         repo: NoteRepository = context["note_repo"]
-        notes = repo.get_all()
+        total = repo.count()
 
-        if not notes:
+        if not total:
             Console.info("No notes found")
             return
 
-        # Prepare data for table
-        table_data = []
-        for note in notes:
-            content_preview = note.content[:60] + "..." if len(note.content) > 60 else note.content
-            tags = ", ".join(note.tags) if note.tags else "N/A"
-            created = note.created_at.strftime("%Y-%m-%d %H:%M")
-
-            table_data.append([content_preview, tags, created])
+        rows = map(_list_row, itertools.islice(repo.iter_all(), LIST_LIMIT))
+        table = render_grid(_LIST_HEADERS, rows)
 
-        headers = ["Content", "Tags", "Created"]
-        table = tabulate(table_data, headers=headers, tablefmt="grid")
+        Console.info_block(f"\nTotal notes: {total}", table)
 
-        Console.info(f"\nTotal notes: {len(notes)}")
-        print(table)
+        if total > LIST_LIMIT:
+            Console.info(f"Showing {LIST_LIMIT} of {total} — use search-notes to filter")
 
 
 class SearchNotesCommand(BaseCommand):
     """Command to search notes."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "search-notes"
@@ -95,7 +154,7 @@ class SearchNotesCommand(BaseCommand):
             Console.info(self.usage)
             return
 
-        query = " ".join(args)
+        query = self._rest(args)
         repo: NoteRepository = context["note_repo"]
         notes = repo.search(query)
 
@@ -104,23 +163,21 @@ class SearchNotesCommand(BaseCommand):
             return
 
         # Display results
-        table_data = []
-        for note in notes:
-            content_preview = note.content[:60] + "..." if len(note.content) > 60 else note.content
-            tags = ", ".join(note.tags) if note.tags else "N/A"
+        table_data = [(preview(note.content), note.tags_str or "N/A") for note in notes[:SEARCH_LIMIT]]
 
-            table_data.append([content_preview, tags])
+        table = render_grid(_SEARCH_HEADERS, table_data)
 
-        headers = ["Content", "Tags"]
-        table = tabulate(table_data, headers=headers, tablefmt="grid")
+        Console.info_block(f"\nFound {len(notes)} note(s) matching '{query}':", table)
 
-        Console.info(f"\nFound {len(notes)} note(s) matching '{query}':")
-        print(table)
+        if len(notes) > SEARCH_LIMIT:
+            Console.info(f"Showing {SEARCH_LIMIT} of {len(notes)} — refine the query to narrow the results")
 
 
 class SearchByTagCommand(BaseCommand):
     """Command to search notes by tag."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "search-tag"
@@ -144,23 +201,18 @@ class SearchByTagCommand(BaseCommand):
             return
 
         # Display results
-        table_data = []
-        for note in notes:
-            content_preview = note.content[:60] + "..." if len(note.content) > 60 else note.content
-            all_tags = ", ".join(note.tags)
+        table_data = [(preview(note.content), note.tags_str) for note in notes]
 
-            table_data.append([content_preview, all_tags])
+        table = render_grid(_TAG_SEARCH_HEADERS, table_data)
 
-        headers = ["Content", "All Tags"]
-        table = tabulate(table_data, headers=headers, tablefmt="grid")
-
-        Console.info(f"\nFound {len(notes)} note(s) with tag '{tag}':")
-        print(table)
+        Console.info_block(f"\nFound {len(notes)} note(s) with tag '{tag}':", table)
 
 
 class EditNoteCommand(BaseCommand):
     """Command to edit a note."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "edit-note"
@@ -179,39 +231,13 @@ class EditNoteCommand(BaseCommand):
             return
 
         search_query = args[0]
-        new_content = " ".join(args[1:])
+        new_content = self._rest(args, 1)
 
         repo: NoteRepository = context["note_repo"]
-        notes = repo.search(search_query)
-
-        if not notes:
-            Console.error(f"No notes found matching '{search_query}'")
+        note = _resolve_one_note(repo, search_query, "edit")
+        if note is None:
             return
 
-        if len(notes) > 1:
-            Console.warning(f"Found {len(notes)} notes matching '{search_query}'")
-            Console.info("Showing first 5 matches:")
-
-            # Show matches
-            for i, note in enumerate(notes[:5]):
-                content_preview = note.content[:60] + "..." if len(note.content) > 60 else note.content
-                print(f"{i+1}. {content_preview}")
-
-            # Ask user to select
-            try:
-                choice = int(Console.prompt("Select note number to edit (0 to cancel)"))
-                if choice == 0:
-                    return
-                if choice < 1 or choice > min(len(notes), 5):
-                    Console.error("Invalid selection")
-                    return
-                note = notes[choice - 1]
-            except ValueError:
-                Console.error("Invalid input")
-                return
-        else:
-            note = notes[0]
-
         try:
             note.content = new_content
             repo.update(note)
@@ -223,6 +249,8 @@ class EditNoteCommand(BaseCommand):
 class DeleteNoteCommand(BaseCommand):
     """Command to delete a note."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "delete-note"
@@ -237,41 +265,14 @@ class DeleteNoteCommand(BaseCommand):
             Console.info(self.usage)
             return
 
-        search_query = " ".join(args)
+        search_query = self._rest(args)
         repo: NoteRepository = context["note_repo"]
-        notes = repo.search(search_query)
-
-        if not notes:
-            Console.error(f"No notes found matching '{search_query}'")
+        note = _resolve_one_note(repo, search_query, "delete")
+        if note is None:
             return
 
-        if len(notes) > 1:
-            Console.warning(f"Found {len(notes)} notes matching '{search_query}'")
-            Console.info("Showing first 5 matches:")
-
-            # Show matches
-            for i, note in enumerate(notes[:5]):
-                content_preview = note.content[:60] + "..." if len(note.content) > 60 else note.content
-                print(f"{i+1}. {content_preview}")
-
-            # Ask user to select
-            try:
-                choice = int(Console.prompt("Select note number to delete (0 to cancel)"))
-                if choice == 0:
-                    return
-                if choice < 1 or choice > min(len(notes), 5):
-                    Console.error("Invalid selection")
-                    return
-                note = notes[choice - 1]
-            except ValueError:
-                Console.error("Invalid input")
-                return
-        else:
-            note = notes[0]
-
         # Confirm deletion
-        content_preview = note.content[:60] + "..." if len(note.content) > 60 else note.content
-        if not Console.confirm(f"Delete note: '{content_preview}'?"):
+        if not self._confirm(f"Delete note: '{preview(note.content)}'?", context):
             Console.info("Deletion cancelled")
             return
 
@@ -285,6 +286,8 @@ class DeleteNoteCommand(BaseCommand):
 class CleanNotesCommand(BaseCommand):
     """Command to delete all notes from the repository."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "clean-notes"
@@ -295,17 +298,14 @@ class CleanNotesCommand(BaseCommand):
 
     def execute(self, args: list[str], context: dict[str, Any]) -> None:
         repo: NoteRepository = context["note_repo"]
-        notes = repo.get_all()
-        if not notes:
+        if not repo.count():
             Console.info("No notes to delete.")
             return
-        if not Console.confirm("Are you sure you want to delete ALL notes? This cannot be undone."):
+        if not self._confirm("Are you sure you want to delete ALL notes? This cannot be undone.", context):
             Console.info("Operation cancelled.")
             return
         try:
-            repo._notes.clear() if hasattr(repo, "_notes") else None
-            if hasattr(repo, "save_data"):
-                repo.save_data([])
+            repo.clear()
             Console.success("All notes deleted successfully!")
         except Exception as e:
             Console.error(f"Failed to delete all notes: {str(e)}")
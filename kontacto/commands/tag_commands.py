@@ -1,15 +1,27 @@
 from typing import Any
 
-from tabulate import tabulate
-
 from ..commands.base_command import BaseCommand
+from ..models.note import Note
 from ..repositories.note_repository import NoteRepository
 from ..ui.console import Console
+from ._display import preview
+
+# Table headers for the list-tags command
+_TAG_HEADERS = ("Tag", "Note Count")
+
+
+def _format_note_choices(notes: list[Note]) -> str:
+    """Format notes as a numbered list of previews with their tags, one block of text."""
+    return "\n".join(
+        f"{i}. {preview(note.content)}\n   Tags: {note.tags_str or 'no tags'}" for i, note in enumerate(notes, 1)
+    )
 
 
 class AddTagCommand(BaseCommand):
     """Command to add tag to a note."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "add-tag"
@@ -29,12 +41,7 @@ class AddTagCommand(BaseCommand):
             return
 
         # Show all notes for selection
-        Console.info(f"Found {len(all_notes)} notes:")
-        for i, note in enumerate(all_notes):
-            content_preview = note.content[:60] + "..." if len(note.content) > 60 else note.content
-            tags_str = ", ".join(sorted(note.tags)) if note.tags else "no tags"
-            print(f"{i+1}. {content_preview}")
-            print(f"   Tags: {tags_str}")
+        Console.info_block(f"Found {len(all_notes)} notes:", _format_note_choices(all_notes))
 
         # Ask user to select a note
         try:
@@ -57,9 +64,10 @@ class AddTagCommand(BaseCommand):
 
         # Add the tag
         try:
-            selected_note.add_tag(tag_name)
-            repo.update(selected_note)
-            Console.success(f"Tag '{tag_name}' added successfully!")
+            if repo.add_tag_to(selected_note, tag_name):
+                Console.success(f"Tag '{tag_name}' added successfully!")
+            else:
+                Console.info(f"Note already has tag '{tag_name}'")
         except Exception as e:
             Console.error(f"Failed to add tag: {str(e)}")
 
@@ -67,6 +75,8 @@ class AddTagCommand(BaseCommand):
 class RemoveTagCommand(BaseCommand):
     """Command to remove tag from a note."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "remove-tag"
@@ -80,19 +90,14 @@ class RemoveTagCommand(BaseCommand):
 
         # Get all notes that have tags
         all_notes = repo.get_all()
-        notes_with_tags = [note for note in all_notes if note.tags]
+        notes_with_tags = [note for note in all_notes if note.sorted_tags]
 
         if not notes_with_tags:
             Console.info("No notes with tags found")
             return
 
         # Show notes with tags for selection
-        Console.info(f"Found {len(notes_with_tags)} notes with tags:")
-        for i, note in enumerate(notes_with_tags):
-            content_preview = note.content[:60] + "..." if len(note.content) > 60 else note.content
-            tags_str = ", ".join(sorted(note.tags))
-            print(f"{i+1}. {content_preview}")
-            print(f"   Tags: {tags_str}")
+        Console.info_block(f"Found {len(notes_with_tags)} notes with tags:", _format_note_choices(notes_with_tags))
 
         # Ask user to select a note
         try:
@@ -108,10 +113,8 @@ class RemoveTagCommand(BaseCommand):
             return
 
         # Show tags on the selected note
-        tags = sorted(selected_note.tags)
-        Console.info("\nTags on selected note:")
-        for i, tag in enumerate(tags):
-            print(f"{i+1}. {tag}")
+        tags = selected_note.sorted_tags
+        Console.info_block("\nTags on selected note:", "\n".join(f"{i}. {tag}" for i, tag in enumerate(tags, 1)))
 
         # Ask user to select a tag to remove
         try:
@@ -128,8 +131,7 @@ class RemoveTagCommand(BaseCommand):
 
         # Remove the tag
         try:
-            selected_note.remove_tag(tag_to_remove)
-            repo.update(selected_note)
+            repo.remove_tag_from(selected_note, tag_to_remove)
             Console.success(f"Tag '{tag_to_remove}' removed successfully!")
         except Exception as e:
             Console.error(f"Failed to remove tag: {str(e)}")
@@ -138,6 +140,8 @@ class RemoveTagCommand(BaseCommand):
 class ListTagsCommand(BaseCommand):
     """Command to list all tags."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "list-tags"
@@ -148,23 +152,22 @@ class ListTagsCommand(BaseCommand):
 
     def execute(self, args: list[str], context: dict[str, Any]) -> None:
         repo: NoteRepository = context["note_repo"]
-        tags = repo.get_all_tags()
-        if not tags:
+        tag_counts = repo.get_tag_counts()
+        if not tag_counts:
             Console.info("No tags found")
             return
-        table_data = []
-        for tag in tags:
-            count = repo.count_by_tag(tag)
-            table_data.append([tag, count])
-        headers = ["Tag", "Note Count"]
-        table = tabulate(table_data, headers=headers, tablefmt="grid")
-        Console.info(f"\nTotal tags: {len(tags)}")
-        print(table)
+        from tabulate import tabulate
+
+        table_data = list(tag_counts.items())
+        table = tabulate(table_data, headers=_TAG_HEADERS, tablefmt="grid")
+        Console.info_block(f"\nTotal tags: {len(tag_counts)}", table)
 
 
 class NotesByTagCommand(BaseCommand):
     """Command to show notes grouped by tags."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "notes-by-tag"
@@ -179,16 +182,18 @@ class NotesByTagCommand(BaseCommand):
         if not grouped:
             Console.info("No tagged notes found")
             return
+        lines = []
         for tag, notes in grouped.items():
-            Console.header(f"Tag: {tag} ({len(notes)} notes)")
-            for note in notes:
-                content_preview = note.content[:80] + "..." if len(note.content) > 80 else note.content
-                print(f"  • {content_preview}")
+            lines.append(Console.format_header(f"Tag: {tag} ({len(notes)} notes)"))
+            lines.extend(f"  • {preview(note.content, 80)}" for note in notes)
+        print("\n".join(lines))
 
 
 class CleanTagsCommand(BaseCommand):
     """Command to remove all tags from every note, keeping the notes themselves."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.name = "clean-tags"
@@ -203,13 +208,11 @@ class CleanTagsCommand(BaseCommand):
         if not notes:
             Console.info("No notes found.")
             return
-        if not Console.confirm("Are you sure you want to remove ALL tags from every note?"):
+        if not self._confirm("Are you sure you want to remove ALL tags from every note?", context):
             Console.info("Operation cancelled.")
             return
         try:
-            for note in notes:
-                note._tags.clear() if hasattr(note, "_tags") else None
-                repo.update(note)
+            repo.clear_all_tags()
             Console.success("All tags removed from all notes!")
         except Exception as e:
             Console.error(f"Failed to remove all tags: {str(e)}")
@@ -1,13 +1,13 @@
 import sys
 from typing import Any
 
-from colorama import init as init_colorama
 from prompt_toolkit import prompt
 from prompt_toolkit.filters import completion_is_selected, has_completions
 from prompt_toolkit.history import FileHistory
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.shortcuts import CompleteStyle
 
+from .commands.base_command import BaseCommand
 from .commands.builtin_commands import ClearCommand, ExitCommand, HelpCommand
 from .commands.command_registry import CommandRegistry
 from .commands.contact_commands import (
@@ -33,16 +33,49 @@ from .repositories.contact_repository import ContactRepository
 from .repositories.note_repository import NoteRepository
 from .ui.command_completer import CommandCompleter
 from .ui.console import Console
-from .utils.fuzzy_matcher import find_best_match, parse_command_input
+from .utils.fuzzy_matcher import parse_command_input
+
+# Every command the application offers; built-in commands come last
+_COMMAND_CLASSES: tuple[type[BaseCommand], ...] = (
+    # Contact commands
+    AddContactCommand,
+    ListContactsCommand,
+    SearchContactsCommand,
+    EditContactCommand,
+    DeleteContactCommand,
+    UpcomingBirthdaysCommand,
+    CleanContactsCommand,
+    # Note commands
+    AddNoteCommand,
+    ListNotesCommand,
+    SearchNotesCommand,
+    SearchByTagCommand,
+    EditNoteCommand,
+    DeleteNoteCommand,
+    CleanNotesCommand,
+    # Tag commands
+    AddTagCommand,
+    RemoveTagCommand,
+    ListTagsCommand,
+    NotesByTagCommand,
+    CleanTagsCommand,
+    # Built-in commands
+    HelpCommand,
+    ExitCommand,
+    ClearCommand,
+)
 
 
 class Kontacto:
     """Main application class"""
 
-    def __init__(self):
-        # Initialize colorama for Windows support
-        init_colorama()
+    def __init__(self, assume_yes: bool = False):
+        """
+        Set up repositories, commands and the prompt.
 
+        Args:
+            assume_yes: Answer yes to every confirmation instead of asking
+        """
         # Initialize repositories
         self.contact_repo = ContactRepository()
         self.note_repo = NoteRepository()
@@ -56,6 +89,7 @@ class Kontacto:
             "contact_repo": self.contact_repo,
             "note_repo": self.note_repo,
             "kontacto": self,
+            "assume_yes": assume_yes,
         }
 
         # Set up key bindings for better Tab completion
@@ -91,39 +125,9 @@ class Kontacto:
         return bindings
 
     def _register_commands(self) -> None:
-        # Contact commands
-        self.command_registry.register(AddContactCommand())
-        self.command_registry.register(ListContactsCommand())
-        self.command_registry.register(SearchContactsCommand())
-        self.command_registry.register(EditContactCommand())
-        self.command_registry.register(DeleteContactCommand())
-        self.command_registry.register(UpcomingBirthdaysCommand())
-        self.command_registry.register(CleanContactsCommand())
-
-        # Note commands
-        self.command_registry.register(AddNoteCommand())
-        self.command_registry.register(ListNotesCommand())
-        self.command_registry.register(SearchNotesCommand())
-        self.command_registry.register(SearchByTagCommand())
-        self.command_registry.register(EditNoteCommand())
-        self.command_registry.register(DeleteNoteCommand())
-        self.command_registry.register(CleanNotesCommand())
-
-        # Tag commands
-        self.command_registry.register(AddTagCommand())
-        self.command_registry.register(RemoveTagCommand())
-        self.command_registry.register(ListTagsCommand())
-        self.command_registry.register(NotesByTagCommand())
-        self.command_registry.register(CleanTagsCommand())
-
-        # Add built-in commands
-        self._add_builtin_commands()
-
-    def _add_builtin_commands(self) -> None:
-        """Add built-in commands like help and exit."""
-        self.command_registry.register(HelpCommand())
-        self.command_registry.register(ExitCommand())
-        self.command_registry.register(ClearCommand())
+        """Register one instance of every command, in help and completion order."""
+        for command_class in _COMMAND_CLASSES:
+            self.command_registry.register(command_class())
 
     def process_command(self, input_text: str) -> None:
         """
@@ -136,28 +140,20 @@ class Kontacto:
             return
 
         # Parse command and arguments
-        command_aliases = {}
-        for cmd_name in self.command_registry.get_command_names():
-            cmd = self.command_registry.get(cmd_name)
-            if cmd:
-                command_aliases[cmd_name] = cmd_name
-                for alias in cmd.aliases:
-                    command_aliases[alias] = cmd_name
-
-        command_name, args = parse_command_input(input_text, command_aliases)
+        command_name, args = parse_command_input(input_text, self.command_registry.get_alias_map())
 
         if not command_name:
             return
 
-        command = self.command_registry.get(command_name)
+        command = self.command_registry.get(sys.intern(command_name))
 
         if not command:
             Console.error(f"Unknown command: {command_name}")
 
             # Suggest similar commands
-            suggestions = find_best_match(command_name, self.command_registry.get_command_names())
-            if suggestions:
-                Console.info(f"Did you mean: {suggestions}?")
+            suggestion = self.command_registry.suggest(command_name)
+            if suggestion:
+                Console.info(f"Did you mean: {suggestion}?")
             else:
                 Console.info("Type 'help' to see available commands.")
             return
@@ -206,9 +202,10 @@ class Kontacto:
 
 
 def main():
-    """Main entry point."""
+    """Main entry point. Pass -y or --yes to skip confirmation prompts."""
+    assume_yes = any(arg in ("-y", "--yes") for arg in sys.argv[1:])
     try:
-        app = Kontacto()
+        app = Kontacto(assume_yes=assume_yes)
         app.run()
     except Exception as e:
         Console.error(f"Fatal error: {str(e)}")
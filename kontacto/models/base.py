@@ -1,6 +1,6 @@
 """Base model classes for the Personal Assistant application."""
 
-import uuid
+import os
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any
@@ -9,11 +9,34 @@ from typing import Any
 class BaseModel(ABC):
     """Abstract base class for all models in the application."""
 
+    # Slots holding values derived from the fields; left out of pickled state
+    _CACHE_SLOTS: tuple[str, ...] = ()
+    __slots__ = ("id", "created_at", "modified_at")
+
     def __init__(self):
         """Initialize the base model with a unique ID and timestamps."""
-        self.id: str = str(uuid.uuid4())
-        self.created_at: datetime = datetime.now()
-        self.modified_at: datetime = datetime.now()
+        now = datetime.now()
+        # 128 random bits as hex: as unique as uuid4 without building a UUID object
+        self.id: str = os.urandom(16).hex()
+        self.created_at: datetime = now
+        self.modified_at: datetime = now
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the pickled state: every slotted field, without caches."""
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if name not in self._CACHE_SLOTS
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore pickled state, including models saved before they used slots."""
+        for name in self._CACHE_SLOTS:
+            setattr(self, name, None)
+        for name, value in state.items():
+            if name not in self._CACHE_SLOTS:
+                setattr(self, name, value)
 
     def update_modified_time(self) -> None:
         """Update the modified timestamp."""
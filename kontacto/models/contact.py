@@ -6,10 +6,17 @@ from typing import Any, Optional
 from ..models.base import BaseModel
 from ..utils.validators import ValidationError, validate_birthday, validate_email, validate_phone
 
+# Placeholder shown in tables for empty fields
+_NA = "N/A"
+
 
 class Contact(BaseModel):
     """Model representing a contact with personal information."""
 
+    # Display strings derived from the fields, rebuilt lazily after changes
+    _CACHE_SLOTS = ("_row_cache", "_phones_str", "_emails_str", "_birthday_str", "_search_blob")
+    __slots__ = ("_name", "_address", "_phones", "_emails", "_birthday", *_CACHE_SLOTS)
+
     def __init__(self, name: str, address: str = "", birthday: Optional[date] = None):
         """
         Initialize a contact.
@@ -20,6 +27,7 @@ class Contact(BaseModel):
             birthday: Contact's birthday
         """
         super().__init__()
+        self._invalidate()
         self._name = name
         self._address = address
         self._phones: list[str] = []
@@ -40,6 +48,7 @@ class Contact(BaseModel):
         if not value or not value.strip():
             raise ValidationError("Name cannot be empty")
         self._name = value.strip()
+        self._invalidate()
         self.update_modified_time()
 
     @property
@@ -51,6 +60,7 @@ class Contact(BaseModel):
     def address(self, value: str) -> None:
         """Set contact's address."""
         self._address = value.strip()
+        self._invalidate()
         self.update_modified_time()
 
     @property
@@ -72,6 +82,7 @@ class Contact(BaseModel):
         if validated_phone in self._phones:
             raise ValidationError(f"Phone {phone} already exists")
         self._phones.append(validated_phone)
+        self._invalidate()
         self.update_modified_time()
 
     def remove_phone(self, phone: str) -> None:
@@ -88,6 +99,7 @@ class Contact(BaseModel):
         if validated_phone not in self._phones:
             raise ValidationError(f"Phone {phone} not found")
         self._phones.remove(validated_phone)
+        self._invalidate()
         self.update_modified_time()
 
     @property
@@ -109,6 +121,7 @@ class Contact(BaseModel):
         if validated_email in self._emails:
             raise ValidationError(f"Email {email} already exists")
         self._emails.append(validated_email)
+        self._invalidate()
         self.update_modified_time()
 
     def remove_email(self, email: str) -> None:
@@ -125,6 +138,7 @@ class Contact(BaseModel):
         if validated_email not in self._emails:
             raise ValidationError(f"Email {email} not found")
         self._emails.remove(validated_email)
+        self._invalidate()
         self.update_modified_time()
 
     @property
@@ -139,8 +153,62 @@ class Contact(BaseModel):
             self._birthday = validate_birthday(value)
         else:
             self._birthday = None
+        self._invalidate()
         self.update_modified_time()
 
+    @property
+    def month_day(self) -> Optional[tuple[int, int]]:
+        """Get the (month, day) of the contact's birthday, if set."""
+        if not self._birthday:
+            return None
+        return self._birthday.month, self._birthday.day
+
+    @property
+    def phones_str(self) -> str:
+        """Get the phone numbers joined with commas, or an empty string."""
+        if self._phones_str is None:
+            self._phones_str = ", ".join(self._phones)
+        return self._phones_str
+
+    @property
+    def emails_str(self) -> str:
+        """Get the email addresses joined with commas, or an empty string."""
+        if self._emails_str is None:
+            self._emails_str = ", ".join(self._emails)
+        return self._emails_str
+
+    @property
+    def birthday_str(self) -> str:
+        """Get the birthday in YYYY-MM-DD format, or an empty string."""
+        if self._birthday_str is None:
+            self._birthday_str = self._birthday.isoformat() if self._birthday else ""
+        return self._birthday_str
+
+    def _invalidate(self) -> None:
+        """Drop display values derived from the contact's fields."""
+        self._row_cache = None
+        self._phones_str = None
+        self._emails_str = None
+        self._birthday_str = None
+        self._search_blob = None
+
+    def table_row(self) -> tuple[str, str, str, str, str]:
+        """
+        Get the contact formatted as a table row.
+
+        Returns:
+            Tuple of name, address, phones, emails and birthday strings
+        """
+        if self._row_cache is None:
+            self._row_cache = (
+                self._name,
+                self._address or _NA,
+                self.phones_str or _NA,
+                self.emails_str or _NA,
+                self.birthday_str or _NA,
+            )
+        return self._row_cache
+
     def days_until_birthday(self) -> Optional[int]:
         """
         Calculate days until next birthday.
@@ -172,31 +240,12 @@ class Contact(BaseModel):
         Returns:
             True if contact matches query
         """
-        query_lower = query.lower()
-
-        # Search in name
-        if query_lower in self._name.lower():
-            return True
-
-        # Search in address
-        if query_lower in self._address.lower():
-            return True
-
-        # Search in phones
-        for phone in self._phones:
-            if query in phone:
-                return True
-
-        # Search in emails
-        for email in self._emails:
-            if query_lower in email.lower():
-                return True
-
-        # Search in birthday
-        if self._birthday and query in str(self._birthday):
-            return True
-
-        return False
+        if self._search_blob is None:
+            # Fields are separated by NUL so a match cannot span two of them
+            self._search_blob = "\0".join(
+                (self._name, self._address, *self._phones, *self._emails, self.birthday_str)
+            ).lower()
+        return query.lower() in self._search_blob
 
     def to_dict(self) -> dict[str, Any]:
         """Convert contact to dictionary representation."""
@@ -226,6 +275,7 @@ class Contact(BaseModel):
 
         self.created_at = datetime.fromisoformat(data["created_at"])
         self.modified_at = datetime.fromisoformat(data["modified_at"])
+        self._invalidate()
 
     def validate(self) -> bool:
         """Validate the contact's data."""
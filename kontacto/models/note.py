@@ -6,10 +6,17 @@ from typing import Any, Optional, Set
 from ..models.base import BaseModel
 from ..utils.validators import ValidationError
 
+# Display format of a note's creation time
+CREATED_FMT = "%Y-%m-%d %H:%M"
+
 
 class Note(BaseModel):
     """Model representing a note with tags."""
 
+    # Lowercased content for search and display strings, rebuilt lazily after changes
+    _CACHE_SLOTS = ("_content_lower", "_sorted_tags", "_tags_str", "_created_cache")
+    __slots__ = ("_content", "_tags", *_CACHE_SLOTS)
+
     def __init__(self, content: str, tags: Optional[list[str]] = None):
         """
         Initialize a note.
@@ -22,11 +29,15 @@ class Note(BaseModel):
         if not content or not content.strip():
             raise ValidationError("Note content cannot be empty")
         self._content = content.strip()
+        self._content_lower: Optional[str] = self._content.lower()
         self._tags: Set[str] = set()
+        self._sorted_tags: Optional[tuple[str, ...]] = None
+        self._tags_str: Optional[str] = None
+        self._created_cache: Optional[tuple[datetime, str]] = None
 
-        if tags:
-            for tag in tags:
-                self.add_tag(tag)
+        # Initial tags are part of creation, so they do not bump modified_at
+        for tag in tags or ():
+            self._insert_tag(tag)
 
     @property
     def content(self) -> str:
@@ -39,28 +50,69 @@ class Note(BaseModel):
         if not value or not value.strip():
             raise ValidationError("Note content cannot be empty")
         self._content = value.strip()
+        self._content_lower = self._content.lower()
         self.update_modified_time()
 
     @property
     def tags(self) -> list[str]:
         """Get list of tags."""
-        return sorted(list(self._tags))
+        return list(self.sorted_tags)
 
-    def add_tag(self, tag: str) -> None:
+    @property
+    def sorted_tags(self) -> tuple[str, ...]:
+        """Get the tags in sorted order, without copying."""
+        if self._sorted_tags is None:
+            self._sorted_tags = tuple(sorted(self._tags))
+        return self._sorted_tags
+
+    @property
+    def tags_str(self) -> str:
+        """Get sorted tags joined with commas, or an empty string."""
+        if self._tags_str is None:
+            self._tags_str = ", ".join(self.sorted_tags)
+        return self._tags_str
+
+    def _invalidate_tags(self) -> None:
+        """Forget cached views of the tags after they change."""
+        self._sorted_tags = None
+        self._tags_str = None
+
+    @property
+    def created_str(self) -> str:
+        """Get the creation time formatted for display."""
+        cached = self._created_cache
+        if cached is None or cached[0] is not self.created_at:
+            cached = self._created_cache = (self.created_at, self.created_at.strftime(CREATED_FMT))
+        return cached[1]
+
+    def add_tag(self, tag: str) -> bool:
         """
         Add a tag to the note.
 
         Args:
             tag: Tag to add
 
+        Returns:
+            True if the tag was added, False if the note already had it
+
         Raises:
             ValidationError: If tag is invalid
         """
-        tag = self._normalize_tag(tag)
+        if not self._insert_tag(tag):
+            return False
+        self._invalidate_tags()
+        self.update_modified_time()
+        return True
+
+    def _insert_tag(self, tag: str) -> bool:
+        """Normalize, validate and store a tag without touching caches or timestamps; return whether it was new."""
+        tag = self.normalize_tag(tag)
         if not tag:
             raise ValidationError("Tag cannot be empty")
+        if tag in self._tags:
+            return False
         self._tags.add(tag)
-        self.update_modified_time()
+        return True
 
     def remove_tag(self, tag: str) -> None:
         """
@@ -72,12 +124,20 @@ class Note(BaseModel):
         Raises:
             ValidationError: If tag doesn't exist
         """
-        tag = self._normalize_tag(tag)
+        tag = self.normalize_tag(tag)
         if tag not in self._tags:
             raise ValidationError(f"Tag '{tag}' not found")
         self._tags.remove(tag)
+        self._invalidate_tags()
         self.update_modified_time()
 
+    def clear_tags(self) -> None:
+        """Remove all tags from the note."""
+        if self._tags:
+            self._tags.clear()
+            self._invalidate_tags()
+            self.update_modified_time()
+
     def has_tag(self, tag: str) -> bool:
         """
         Check if note has a specific tag.
@@ -88,7 +148,7 @@ class Note(BaseModel):
         Returns:
             True if note has the tag
         """
-        tag = self._normalize_tag(tag)
+        tag = self.normalize_tag(tag)
         return tag in self._tags
 
     def matches_search(self, query: str) -> bool:
@@ -104,7 +164,10 @@ class Note(BaseModel):
         query_lower = query.lower()
 
         # Search in content
-        if query_lower in self._content.lower():
+        content_lower = self._content_lower
+        if content_lower is None:
+            content_lower = self._content_lower = self._content.lower()
+        if query_lower in content_lower:
             return True
 
         # Search in tags
@@ -114,7 +177,8 @@ class Note(BaseModel):
 
         return False
 
-    def _normalize_tag(self, tag: str) -> str:
+    @staticmethod
+    def normalize_tag(tag: str) -> str:
         """
         Normalize tag format.
 
@@ -146,7 +210,9 @@ class Note(BaseModel):
         """Load note from dictionary representation."""
         self.id = data["id"]
         self._content = data["content"]
+        self._content_lower = self._content.lower()
         self._tags = set(data.get("tags", []))
+        self._invalidate_tags()
         self.created_at = datetime.fromisoformat(data["created_at"])
         self.modified_at = datetime.fromisoformat(data["modified_at"])
 
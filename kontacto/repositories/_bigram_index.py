@@ -0,0 +1,125 @@
+"""Character bigram inverted index used to narrow repository searches."""
+
+from typing import Iterable, Optional
+
+
+def bigrams(text: str) -> set[str]:
+    """
+    Split text into its set of overlapping two-character shingles.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        Set of bigrams, empty for texts shorter than two characters
+    """
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+class BigramIndex:
+    """Inverted index from character bigrams to item keys."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: dict[str, set[str]] = {}
+        self._grams: dict[str, set[str]] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+
+    def add(self, key: str, text: str) -> None:
+        """
+        Index an item's text, replacing any text indexed for the key before.
+
+        Replacing keeps the item's original insertion position.
+
+        Args:
+            key: Item key
+            text: Lowercased searchable text of the item
+        """
+        if key in self._grams:
+            self._unlink(key)
+        else:
+            self._order[key] = self._next_order
+            self._next_order += 1
+
+        grams = bigrams(text)
+        self._grams[key] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        """
+        Remove an item from the index.
+
+        Args:
+            key: Item key
+        """
+        if key in self._grams:
+            self._unlink(key)
+            del self._grams[key]
+            del self._order[key]
+
+    def clear(self) -> None:
+        """Remove all items from the index."""
+        self._postings.clear()
+        self._grams.clear()
+        self._order.clear()
+
+    def match_all(self, query: str) -> Optional[set[str]]:
+        """
+        Find items containing every bigram of the query.
+
+        Every item whose text contains the query as a substring is included.
+
+        Args:
+            query: Lowercased query
+
+        Returns:
+            Set of candidate keys, or None if the query is too short to filter on
+        """
+        grams = bigrams(query)
+        if not grams:
+            return None
+
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        return candidates
+
+    def match_any(self, query: str) -> set[str]:
+        """
+        Find items sharing at least one bigram with the query.
+
+        Args:
+            query: Lowercased query
+
+        Returns:
+            Set of candidate keys
+        """
+        candidates: set[str] = set()
+        for gram in bigrams(query):
+            candidates |= self._postings.get(gram, set())
+        return candidates
+
+    def ordered(self, keys: Iterable[str]) -> list[str]:
+        """
+        Sort keys by the order their items were first added.
+
+        Args:
+            keys: Keys of indexed items
+
+        Returns:
+            Keys in insertion order
+        """
+        return sorted(keys, key=self._order.__getitem__)
+
+    def _unlink(self, key: str) -> None:
+        """Drop a key from the postings of its bigrams."""
+        for gram in self._grams[key]:
+            posting = self._postings[gram]
+            posting.discard(key)
+            if not posting:
+                del self._postings[gram]
@@ -1,10 +1,50 @@
 """Contact repository for managing contact persistence."""
 
-from typing import Optional
+import calendar
+import functools
+from datetime import date, timedelta
+from typing import Iterator, Optional
+
+from rapidfuzz import fuzz, process
 
 from ..models.contact import Contact
+from ._bigram_index import BigramIndex
 from .base_repository import BaseRepository
 
+# Minimum WRatio score (0-100) for a fuzzy search hit
+FUZZY_SCORE_CUTOFF = 70
+# Maximum number of fuzzy hits added on top of substring matches
+FUZZY_LIMIT = 50
+# Queries shorter than this only use substring matching
+FUZZY_MIN_QUERY = 3
+# Number of distinct names and queries remembered by the read caches
+READ_CACHE_SIZE = 256
+
+
+def birthday_window(days: int) -> dict[tuple[int, int], int]:
+    """
+    Map each (month, day) in the next N days to its distance from today.
+
+    The mapping is ordered by distance. February 29 birthdays fall on
+    February 28 in common years.
+
+    Args:
+        days: Number of days to look ahead
+
+    Returns:
+        Dictionary of (month, day) to days left
+    """
+    today = date.today()
+    window: dict[tuple[int, int], int] = {}
+
+    for offset in range(min(days, 366) + 1):
+        day = today + timedelta(days=offset)
+        window.setdefault((day.month, day.day), offset)
+        if day.month == 2 and day.day == 28 and not calendar.isleap(day.year):
+            window.setdefault((2, 29), offset)
+
+    return window
+
 
 class ContactRepository(BaseRepository[Contact]):
     """Repository for managing contacts."""
@@ -18,6 +58,17 @@ class ContactRepository(BaseRepository[Contact]):
         """
         super().__init__(file_path)
         self._contacts: list[Contact] = self.load_data()
+        self._by_id: dict[str, Contact] = {}
+        # Lowercased "name address phones emails" fuzzy search strings by contact ID
+        self._haystacks: dict[str, str] = {}
+        self._index = BigramIndex()
+        # Memoized read paths, cleared whenever the contacts change
+        self._get_by_name_cached = functools.lru_cache(maxsize=READ_CACHE_SIZE)(self._find_by_name)
+        self._search_cached = functools.lru_cache(maxsize=READ_CACHE_SIZE)(self._search)
+        # Contacts grouped by birthday (month, day), rebuilt lazily after writes
+        self._birthday_index: Optional[dict[tuple[int, int], list[Contact]]] = None
+        for contact in self._contacts:
+            self._index_contact(contact)
 
     def add(self, contact: Contact) -> None:
         """
@@ -33,6 +84,28 @@ class ContactRepository(BaseRepository[Contact]):
             raise ValueError(f"Contact with ID {contact.id} already exists")
 
         self._contacts.append(contact)
+        self._index_contact(contact)
+        self.save_data(self._contacts)
+
+    def add_many(self, contacts: list[Contact]) -> None:
+        """
+        Add several contacts, saving the repository once.
+
+        Args:
+            contacts: Contacts to add
+
+        Raises:
+            ValueError: If a contact ID already exists or is repeated in the batch
+        """
+        known_ids = {contact.id for contact in self._contacts}
+        for contact in contacts:
+            if contact.id in known_ids:
+                raise ValueError(f"Contact with ID {contact.id} already exists")
+            known_ids.add(contact.id)
+
+        self._contacts.extend(contacts)
+        for contact in contacts:
+            self._index_contact(contact)
         self.save_data(self._contacts)
 
     def get(self, contact_id: str) -> Optional[Contact]:
@@ -45,10 +118,7 @@ class ContactRepository(BaseRepository[Contact]):
         Returns:
             Contact if found, None otherwise
         """
-        for contact in self._contacts:
-            if contact.id == contact_id:
-                return contact
-        return None
+        return self._by_id.get(contact_id)
 
     def get_by_name(self, name: str) -> Optional[Contact]:
         """
@@ -60,7 +130,10 @@ class ContactRepository(BaseRepository[Contact]):
         Returns:
             First matching contact if found, None otherwise
         """
-        name_lower = name.lower()
+        return self._get_by_name_cached(name.lower())
+
+    def _find_by_name(self, name_lower: str) -> Optional[Contact]:
+        """Scan for the first contact whose lowercased name equals name_lower."""
         for contact in self._contacts:
             if contact.name.lower() == name_lower:
                 return contact
@@ -75,6 +148,17 @@ class ContactRepository(BaseRepository[Contact]):
         """
         return self._contacts.copy()
 
+    def iter_all(self) -> Iterator[Contact]:
+        """
+        Iterate over all contacts without copying the list.
+
+        The repository must not be modified while iterating.
+
+        Returns:
+            Iterator over all contacts
+        """
+        return iter(self._contacts)
+
     def update(self, contact: Contact) -> None:
         """
         Update an existing contact.
@@ -88,11 +172,25 @@ class ContactRepository(BaseRepository[Contact]):
         for i, existing in enumerate(self._contacts):
             if existing.id == contact.id:
                 self._contacts[i] = contact
+                self._index_contact(contact)
                 self.save_data(self._contacts)
                 return
 
         raise ValueError(f"Contact with ID {contact.id} not found")
 
+    def refresh(self, contact: Contact) -> None:
+        """
+        Re-index a contact that was changed in place, without saving it.
+
+        Call this when an edit fails partway, so search results do not
+        reflect the contact's previous values.
+
+        Args:
+            contact: Contact to re-index
+        """
+        if contact.id in self._by_id:
+            self._index_contact(contact)
+
     def delete(self, contact_id: str) -> None:
         """
         Delete a contact by ID.
@@ -106,6 +204,7 @@ class ContactRepository(BaseRepository[Contact]):
         for i, contact in enumerate(self._contacts):
             if contact.id == contact_id:
                 del self._contacts[i]
+                self._unindex_contact(contact_id)
                 self.save_data(self._contacts)
                 return
 
@@ -115,17 +214,80 @@ class ContactRepository(BaseRepository[Contact]):
         """
         Search for contacts matching the query.
 
+        Substring matches come first, in insertion order, followed by fuzzy
+        matches on the combined contact fields ordered by score. Both passes
+        only look at contacts sharing character bigrams with the query.
+
         Args:
             query: Search query string
 
         Returns:
             List of matching contacts
         """
-        results = []
-        for contact in self._contacts:
-            if contact.matches_search(query):
-                results.append(contact)
-        return results
+        return list(self._search_cached(query))
+
+    def _search(self, query: str) -> tuple[Contact, ...]:
+        """Run an uncached search; see search()."""
+        candidates = self._index.match_all(query.lower())
+        if candidates is None:
+            pool = self._contacts
+        else:
+            pool = [self._by_id[contact_id] for contact_id in self._index.ordered(candidates)]
+        results = [contact for contact in pool if contact.matches_search(query)]
+
+        query_lower = query.strip().lower()
+        if len(query_lower) < FUZZY_MIN_QUERY:
+            return tuple(results)
+
+        found = {contact.id for contact in results}
+        choices = {
+            contact_id: self._haystacks[contact_id]
+            for contact_id in self._index.match_any(query_lower)
+            if contact_id not in found
+        }
+        for _, _, contact_id in process.extract(
+            query_lower,
+            choices,
+            scorer=fuzz.WRatio,
+            score_cutoff=FUZZY_SCORE_CUTOFF,
+            limit=FUZZY_LIMIT,
+        ):
+            results.append(self._by_id[contact_id])
+
+        return tuple(results)
+
+    def _index_contact(self, contact: Contact) -> None:
+        """
+        Add or refresh a contact in the lookup and search indexes.
+
+        Args:
+            contact: Contact to index
+        """
+        haystack = f"{contact.name} {contact.address} {' '.join(contact.phones)} {' '.join(contact.emails)}".lower()
+        birthday = str(contact.birthday) if contact.birthday else ""
+
+        self._by_id[contact.id] = contact
+        self._haystacks[contact.id] = haystack
+        self._index.add(contact.id, f"{haystack} {birthday}")
+        self._clear_read_caches()
+
+    def _unindex_contact(self, contact_id: str) -> None:
+        """
+        Remove a contact from the lookup and search indexes.
+
+        Args:
+            contact_id: ID of the contact to remove
+        """
+        self._by_id.pop(contact_id, None)
+        self._haystacks.pop(contact_id, None)
+        self._index.remove(contact_id)
+        self._clear_read_caches()
+
+    def _clear_read_caches(self) -> None:
+        """Forget memoized get_by_name() and search() results."""
+        self._get_by_name_cached.cache_clear()
+        self._search_cached.cache_clear()
+        self._birthday_index = None
 
     def get_upcoming_birthdays(self, days: int = 7) -> list[Contact]:
         """
@@ -135,21 +297,46 @@ class ContactRepository(BaseRepository[Contact]):
             days: Number of days to look ahead
 
         Returns:
-            List of contacts with upcoming birthdays
+            List of contacts with upcoming birthdays, soonest first
         """
-        results = []
+        return [contact for contact, _ in self.get_upcoming_birthdays_with_days(days)]
 
-        for contact in self._contacts:
-            if contact.birthday:
-                days_until = contact.days_until_birthday()
-                if days_until is not None and 0 <= days_until <= days:
-                    results.append(contact)
+    def get_upcoming_birthdays_with_days(self, days: int = 7) -> list[tuple[Contact, int]]:
+        """
+        Get contacts with birthdays in the next N days, with the days left.
+
+        Looks up each date of the window in the birthday index instead of
+        computing every contact's next birthday.
 
-        # Sort by days until birthday
-        results.sort(key=lambda c: c.days_until_birthday() or 0)
+        Args:
+            days: Number of days to look ahead
 
+        Returns:
+            List of (contact, days left) tuples, soonest first
+        """
+        index = self._get_birthday_index()
+        results = []
+        for month_day, days_left in birthday_window(days).items():
+            for contact in index.get(month_day, ()):
+                results.append((contact, days_left))
         return results
 
+    def _get_birthday_index(self) -> dict[tuple[int, int], list[Contact]]:
+        """
+        Get contacts grouped by birthday, building the groups if stale.
+
+        Returns:
+            Dictionary of (month, day) to contacts in insertion order
+        """
+        if self._birthday_index is None:
+            index: dict[tuple[int, int], list[Contact]] = {}
+            for contact in self._contacts:
+                month_day = contact.month_day
+                if month_day is not None:
+                    index.setdefault(month_day, []).append(contact)
+            self._birthday_index = index
+        return self._birthday_index
+
     def count(self) -> int:
         """
         Get the total number of contacts.
@@ -159,6 +346,19 @@ class ContactRepository(BaseRepository[Contact]):
         """
         return len(self._contacts)
 
+    def clear(self) -> None:
+        """Delete all contacts and save the empty repository."""
+        self._contacts.clear()
+        self._by_id.clear()
+        self._haystacks.clear()
+        self._index.clear()
+        self._clear_read_caches()
+        self.save_data(self._contacts)
+
+    def __len__(self) -> int:
+        """Get the total number of contacts."""
+        return len(self._contacts)
+
     def load_data(self) -> list[Contact]:
         """
         Load contacts from file.
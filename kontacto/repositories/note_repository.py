@@ -1,11 +1,16 @@
 """Note repository for managing note persistence."""
 
-from collections import defaultdict
-from typing import Optional
+import functools
+import itertools
+from typing import Iterator, Optional
 
 from ..models.note import Note
+from ._bigram_index import BigramIndex
 from .base_repository import BaseRepository
 
+# Number of distinct queries remembered by the search cache
+SEARCH_CACHE_SIZE = 32
+
 
 class NoteRepository(BaseRepository[Note]):
     """Repository for managing notes."""
@@ -19,6 +24,15 @@ class NoteRepository(BaseRepository[Note]):
         """
         super().__init__(file_path)
         self._notes: list[Note] = self.load_data()
+        self._by_id: dict[str, Note] = {}
+        self._index = BigramIndex()
+        # Note IDs by tag, and the tags each note was indexed under
+        self._tag_index: dict[str, set[str]] = {}
+        self._indexed_tags: dict[str, tuple[str, ...]] = {}
+        # Memoized searches by lowercased query, cleared whenever the notes change
+        self._search_cached = functools.lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._search)
+        for note in self._notes:
+            self._index_note(note)
 
     def add(self, note: Note) -> None:
         """
@@ -34,7 +48,29 @@ class NoteRepository(BaseRepository[Note]):
             raise ValueError(f"Note with ID {note.id} already exists")
 
         self._notes.append(note)
-        self.save_data(self._notes)
+        self._index_note(note)
+        self.save()
+
+    def add_many(self, notes: list[Note]) -> None:
+        """
+        Add several notes, saving the repository once.
+
+        Args:
+            notes: Notes to add
+
+        Raises:
+            ValueError: If a note ID already exists or is repeated in the batch
+        """
+        known_ids = set(self._by_id)
+        for note in notes:
+            if note.id in known_ids:
+                raise ValueError(f"Note with ID {note.id} already exists")
+            known_ids.add(note.id)
+
+        self._notes.extend(notes)
+        for note in notes:
+            self._index_note(note)
+        self.save()
 
     def get(self, note_id: str) -> Optional[Note]:
         """
@@ -46,10 +82,7 @@ class NoteRepository(BaseRepository[Note]):
         Returns:
             Note if found, None otherwise
         """
-        for note in self._notes:
-            if note.id == note_id:
-                return note
-        return None
+        return self._by_id.get(note_id)
 
     def get_all(self) -> list[Note]:
         """
@@ -60,6 +93,17 @@ class NoteRepository(BaseRepository[Note]):
         """
         return self._notes.copy()
 
+    def iter_all(self) -> Iterator[Note]:
+        """
+        Iterate over all notes without copying the list.
+
+        The repository must not be modified while iterating.
+
+        Returns:
+            Iterator over all notes
+        """
+        return iter(self._notes)
+
     def update(self, note: Note) -> None:
         """
         Update an existing note.
@@ -73,11 +117,56 @@ class NoteRepository(BaseRepository[Note]):
         for i, existing in enumerate(self._notes):
             if existing.id == note.id:
                 self._notes[i] = note
-                self.save_data(self._notes)
+                self._index_note(note)
+                self.save()
                 return
 
         raise ValueError(f"Note with ID {note.id} not found")
 
+    def add_tag_to(self, note: Note, tag: str) -> bool:
+        """
+        Add a tag to a stored note and save the repository if it changed.
+
+        Args:
+            note: Note in the repository
+            tag: Tag to add
+
+        Returns:
+            True if the tag was added, False if the note already had it
+
+        Raises:
+            ValueError: If note doesn't exist
+            ValidationError: If tag is invalid
+        """
+        self._require(note)
+        if not note.add_tag(tag):
+            return False
+        self._index_note(note)
+        self.save()
+        return True
+
+    def remove_tag_from(self, note: Note, tag: str) -> None:
+        """
+        Remove a tag from a stored note and save the repository.
+
+        Args:
+            note: Note in the repository
+            tag: Tag to remove
+
+        Raises:
+            ValueError: If note doesn't exist
+            ValidationError: If the note doesn't have the tag
+        """
+        self._require(note)
+        note.remove_tag(tag)
+        self._index_note(note)
+        self.save()
+
+    def _require(self, note: Note) -> None:
+        """Raise ValueError unless the note is stored in the repository."""
+        if self._by_id.get(note.id) is not note:
+            raise ValueError(f"Note with ID {note.id} not found")
+
     def delete(self, note_id: str) -> None:
         """
         Delete a note by ID.
@@ -91,26 +180,43 @@ class NoteRepository(BaseRepository[Note]):
         for i, note in enumerate(self._notes):
             if note.id == note_id:
                 del self._notes[i]
-                self.save_data(self._notes)
+                self._unindex_note(note_id)
+                self.save()
                 return
 
         raise ValueError(f"Note with ID {note_id} not found")
 
-    def search(self, query: str) -> list[Note]:
+    def search(self, query: str, limit: Optional[int] = None) -> list[Note]:
         """
         Search for notes matching the query.
 
+        Only notes sharing every character bigram with the query are checked
+        against it. Unlimited searches are memoized until the notes change;
+        limited ones stop scanning once enough notes matched.
+
         Args:
             query: Search query string
+            limit: Maximum number of notes to return, or None for all
 
         Returns:
             List of matching notes
         """
-        results = []
-        for note in self._notes:
-            if note.matches_search(query):
-                results.append(note)
-        return results
+        if limit is None:
+            return list(self._search_cached(query.lower()))
+        return list(itertools.islice(self._iter_matches(query.lower()), limit))
+
+    def _search(self, query_lower: str) -> tuple[Note, ...]:
+        """Run an uncached search for a lowercased query; see search()."""
+        return tuple(self._iter_matches(query_lower))
+
+    def _iter_matches(self, query_lower: str) -> Iterator[Note]:
+        """Yield notes matching a lowercased query, in insertion order."""
+        candidates = self._index.match_all(query_lower)
+        if candidates is None:
+            pool = self._notes
+        else:
+            pool = [self._by_id[note_id] for note_id in self._index.ordered(candidates)]
+        return (note for note in pool if note.matches_search(query_lower))
 
     def search_by_tag(self, tag: str) -> list[Note]:
         """
@@ -122,11 +228,46 @@ class NoteRepository(BaseRepository[Note]):
         Returns:
             List of notes with the tag
         """
-        results = []
-        for note in self._notes:
-            if note.has_tag(tag):
-                results.append(note)
-        return results
+        note_ids = self._tag_index.get(Note.normalize_tag(tag), ())
+        return [self._by_id[note_id] for note_id in self._index.ordered(note_ids)]
+
+    def _index_note(self, note: Note) -> None:
+        """
+        Add or refresh a note in the lookup, search and tag indexes.
+
+        Args:
+            note: Note to index
+        """
+        tags = note.sorted_tags
+        self._unlink_tags(note.id)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(note.id)
+
+        self._by_id[note.id] = note
+        self._indexed_tags[note.id] = tags
+        self._index.add(note.id, "\0".join([note.content.lower(), *tags]))
+        self._search_cached.cache_clear()
+
+    def _unindex_note(self, note_id: str) -> None:
+        """
+        Remove a note from the lookup, search and tag indexes.
+
+        Args:
+            note_id: ID of the note to remove
+        """
+        self._unlink_tags(note_id)
+        self._by_id.pop(note_id, None)
+        self._indexed_tags.pop(note_id, None)
+        self._index.remove(note_id)
+        self._search_cached.cache_clear()
+
+    def _unlink_tags(self, note_id: str) -> None:
+        """Drop a note ID from the tag index entries it was indexed under."""
+        for tag in self._indexed_tags.get(note_id, ()):
+            note_ids = self._tag_index[tag]
+            note_ids.discard(note_id)
+            if not note_ids:
+                del self._tag_index[tag]
 
     def get_all_tags(self) -> list[str]:
         """
@@ -135,28 +276,28 @@ class NoteRepository(BaseRepository[Note]):
         Returns:
             Sorted list of unique tags
         """
-        tags = set()
-        for note in self._notes:
-            tags.update(note.tags)
-        return sorted(list(tags))
+        return sorted(self._tag_index)
 
-    def get_notes_by_tags(self) -> dict[str, list[Note]]:
+    def get_tag_counts(self) -> dict[str, int]:
         """
-        Get notes grouped by tags.
+        Count notes for every tag in one pass over the tag index.
 
         Returns:
-            Dictionary mapping tags to lists of notes
+            Dictionary mapping tags, in sorted order, to note counts
         """
-        grouped = defaultdict(list)
-        for note in self._notes:
-            for tag in note.tags:
-                grouped[tag].append(note)
+        return {tag: len(note_ids) for tag, note_ids in sorted(self._tag_index.items())}
 
-        # Sort notes within each tag by creation date
-        for tag in grouped:
-            grouped[tag].sort(key=lambda n: n.created_at)
+    def get_notes_by_tags(self) -> dict[str, list[Note]]:
+        """
+        Get notes grouped by tags.
 
-        return dict(grouped)
+        Returns:
+            Dictionary mapping tags, in sorted order, to lists of notes
+        """
+        return {
+            tag: sorted(map(self._by_id.__getitem__, self._index.ordered(note_ids)), key=lambda n: n.created_at)
+            for tag, note_ids in sorted(self._tag_index.items())
+        }
 
     def count(self) -> int:
         """
@@ -167,6 +308,24 @@ class NoteRepository(BaseRepository[Note]):
         """
         return len(self._notes)
 
+    def clear(self) -> None:
+        """Delete all notes and save the empty repository."""
+        self._notes.clear()
+        self._by_id.clear()
+        self._index.clear()
+        self._tag_index.clear()
+        self._indexed_tags.clear()
+        self._search_cached.cache_clear()
+        self.save()
+
+    def clear_all_tags(self) -> None:
+        """Remove every tag from every note and save the repository once."""
+        for note in self._notes:
+            if note.sorted_tags:
+                note.clear_tags()
+                self._index_note(note)
+        self.save()
+
     def count_by_tag(self, tag: str) -> int:
         """
         Count notes with a specific tag.
@@ -177,7 +336,11 @@ class NoteRepository(BaseRepository[Note]):
         Returns:
             Number of notes with the tag
         """
-        return len(self.search_by_tag(tag))
+        return len(self._tag_index.get(Note.normalize_tag(tag), ()))
+
+    def save(self) -> None:
+        """Persist all notes in a single write."""
+        self.save_data(self._notes)
 
     def load_data(self) -> list[Note]:
         """
@@ -1,5 +1,7 @@
 """Command completer for interactive command-line interface."""
 
+from typing import Sequence
+
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 
@@ -9,12 +11,12 @@ from ..utils.fuzzy_matcher import get_command_suggestions
 class CommandCompleter(Completer):
     """Completer for command suggestions."""
 
-    def __init__(self, command_names: list[str]):
+    def __init__(self, command_names: Sequence[str]):
         """
         Initialize the command completer.
 
         Args:
-            command_names: List of available command names
+            command_names: Available command names
         """
         self.command_names = command_names
 
@@ -29,6 +29,11 @@ class Console:
         """Print an info message in cyan."""
         print(f"{Fore.CYAN}ℹ {message}{Style.RESET_ALL}")
 
+    @staticmethod
+    def info_block(message: str, body: str) -> None:
+        """Print an info message in cyan followed by a block of text, in a single write."""
+        print(f"{Fore.CYAN}ℹ {message}{Style.RESET_ALL}\n{body}")
+
     @staticmethod
     def prompt(message: str = "") -> str:
         """
@@ -47,9 +52,21 @@ class Console:
     @staticmethod
     def header(message: str) -> None:
         """Print a header message."""
-        print(f"\n{Fore.MAGENTA}{'=' * len(message)}")
-        print(message)
-        print(f"{'=' * len(message)}{Style.RESET_ALL}\n")
+        print(Console.format_header(message))
+
+    @staticmethod
+    def format_header(message: str) -> str:
+        """
+        Format a header message without printing it.
+
+        Args:
+            message: Header text
+
+        Returns:
+            Header text framed by magenta rules
+        """
+        rule = "=" * len(message)
+        return f"\n{Fore.MAGENTA}{rule}\n{message}\n{rule}{Style.RESET_ALL}\n"
 
     @staticmethod
     def confirm(message: str) -> bool:
@@ -0,0 +1,37 @@
+"""Grid table rendering for command output."""
+
+from typing import Any, Iterable, Sequence
+
+
+def render_grid(headers: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    """
+    Render rows as a grid table.
+
+    The layout matches tabulate's "grid" format with left-aligned text
+    columns. Column widths are measured in one pass and every line is
+    padded with str.ljust.
+
+    Args:
+        headers: Column headers
+        rows: Table rows, each with one cell per column
+
+    Returns:
+        Rendered table
+    """
+    cells = [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(header) + 2, max((len(row[i]) for row in cells), default=0)) for i, header in enumerate(headers)]
+
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    header_separator = separator.replace("-", "=")
+
+    def format_row(row: Sequence[str]) -> str:
+        return "| " + " | ".join(cell.ljust(width) for cell, width in zip(row, widths)) + " |"
+
+    lines = [separator, format_row(headers), header_separator]
+    for row in cells:
+        lines.append(format_row(row))
+        lines.append(separator)
+    if not cells:
+        lines.append(separator)
+
+    return "\n".join(lines)
@@ -8,7 +8,7 @@ from .fuzzy_matcher import (
     levenshtein_distance,
     parse_command_input,
 )
-from .validators import ValidationError, parse_date, validate_birthday, validate_email, validate_phone
+from .validators import ValidationError, parse_date, parse_dmy_date, validate_birthday, validate_email, validate_phone
 
 __all__ = [
     "ValidationError",
@@ -16,6 +16,7 @@ __all__ = [
     "validate_email",
     "validate_birthday",
     "parse_date",
+    "parse_dmy_date",
     "levenshtein_distance",
     "find_best_match",
     "find_suggestions",
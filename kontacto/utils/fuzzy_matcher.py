@@ -1,10 +1,10 @@
 """Fuzzy matching utilities for command suggestions."""
 
 import shlex
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 
 from rapidfuzz import distance as rapidfuzz_distance
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 
 def levenshtein_distance(s1: str, s2: str) -> int:
@@ -21,13 +21,13 @@ def levenshtein_distance(s1: str, s2: str) -> int:
     return int(rapidfuzz_distance.Levenshtein.distance(s1.lower(), s2.lower()))
 
 
-def find_best_match(query: str, candidates: list[str], threshold: float = 0.6) -> Optional[str]:
+def find_best_match(query: str, candidates: Sequence[str], threshold: float = 0.6) -> Optional[str]:
     """
     Find the best matching string from candidates.
 
     Args:
         query: Query string
-        candidates: List of candidate strings
+        candidates: Sequence of candidate strings
         threshold: Minimum similarity ratio (0.0 to 1.0)
 
     Returns:
@@ -36,20 +36,11 @@ def find_best_match(query: str, candidates: list[str], threshold: float = 0.6) -
     if not candidates:
         return None
 
-    query_lower = query.lower()
-    best_match = None
-    best_ratio = 0.0
-
-    for candidate in candidates:
-        ratio = fuzz.ratio(query_lower, candidate.lower()) / 100.0
-        if ratio > best_ratio and ratio >= threshold:
-            best_ratio = ratio
-            best_match = candidate
-
-    return best_match
+    match = process.extractOne(query, candidates, scorer=fuzz.ratio, processor=str.lower, score_cutoff=threshold * 100)
+    return match[0] if match else None
 
 
-def find_suggestions(query: str, candidates: list[str], max_suggestions: int = 3) -> list[tuple[str, float]]:
+def find_suggestions(query: str, candidates: Sequence[str], max_suggestions: int = 3) -> list[tuple[str, float]]:
     """
     Find multiple matching suggestions sorted by similarity.
 
@@ -64,16 +55,8 @@ def find_suggestions(query: str, candidates: list[str], max_suggestions: int = 3
     if not candidates:
         return []
 
-    query_lower = query.lower()
-    suggestions = []
-
-    for candidate in candidates:
-        ratio = fuzz.ratio(query_lower, candidate.lower()) / 100.0
-        suggestions.append((candidate, ratio))
-
-    # Sort by ratio (descending) and return top suggestions
-    suggestions.sort(key=lambda x: x[1], reverse=True)
-    return suggestions[:max_suggestions]
+    matches = process.extract(query, candidates, scorer=fuzz.ratio, processor=str.lower, limit=max_suggestions)
+    return [(candidate, score / 100.0) for candidate, score, _ in matches]
 
 
 def is_partial_match(query: str, candidate: str) -> bool:
@@ -90,7 +73,7 @@ def is_partial_match(query: str, candidate: str) -> bool:
     return candidate.lower().startswith(query.lower())
 
 
-def get_command_suggestions(input_text: str, available_commands: list[str]) -> list[str]:
+def get_command_suggestions(input_text: str, available_commands: Sequence[str]) -> list[str]:
     """
     Get command suggestions based on user input.
 
@@ -113,7 +96,7 @@ def get_command_suggestions(input_text: str, available_commands: list[str]) -> l
     return [cmd for cmd, ratio in fuzzy_suggestions if ratio > 0.4]
 
 
-def parse_command_input(input_text: str, command_aliases: dict) -> tuple[str, list[str]]:
+def parse_command_input(input_text: str, command_aliases: Mapping[str, str]) -> tuple[str, list[str]]:
     """
     Parse command input into command and arguments.
 
@@ -135,10 +118,6 @@ def parse_command_input(input_text: str, command_aliases: dict) -> tuple[str, li
         return "", []
 
     command = parts[0].lower()
-    args = parts[1:]
-
-    # Check if command is an alias
-    if command in command_aliases:
-        command = command_aliases[command]
 
-    return command, args
+    # Resolve aliases to their command name
+    return command_aliases.get(command, command), parts[1:]
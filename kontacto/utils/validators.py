@@ -2,6 +2,12 @@ import re
 from datetime import date, datetime
 from typing import Optional
 
+# Formats accepted by parse_date, in order of preference
+_DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%m/%d/%Y", "%Y.%m.%d", "%d.%m.%Y")
+_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DMY_FMT = "%d.%m.%Y"
+_DMY_RE = re.compile(r"^(\d{2})\.(\d{2})\.(\d{4})$")
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -93,19 +99,41 @@ def parse_date(date_string: str) -> Optional[date]:
     Returns:
         Parsed date or None if parsing fails
     """
-    formats = [
-        "%Y-%m-%d",
-        "%d-%m-%Y",
-        "%d/%m/%Y",
-        "%m/%d/%Y",
-        "%Y.%m.%d",
-        "%d.%m.%Y",
-    ]
-
-    for fmt in formats:
+    # Fast paths for the two most common formats; anything else goes through strptime
+    if _ISO_RE.match(date_string):
+        try:
+            return date.fromisoformat(date_string)
+        except ValueError:
+            pass
+    elif _DMY_RE.match(date_string):
+        try:
+            return parse_dmy_date(date_string)
+        except ValueError:
+            pass
+
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_string, fmt).date()
         except ValueError:
             continue
 
     return None
+
+
+def parse_dmy_date(date_string: str) -> date:
+    """
+    Parse a date in DD.MM.YYYY format.
+
+    Args:
+        date_string: Date string to parse
+
+    Returns:
+        Parsed date
+
+    Raises:
+        ValueError: If the string is not a valid DD.MM.YYYY date
+    """
+    match = _DMY_RE.match(date_string)
+    if match:
+        return date(int(match[3]), int(match[2]), int(match[1]))
+    return datetime.strptime(date_string, _DMY_FMT).date()
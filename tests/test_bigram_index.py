@@ -0,0 +1,36 @@
+from kontacto.repositories._bigram_index import BigramIndex, bigrams
+
+
+class TestBigramIndex:
+    """Test cases for the bigram inverted index."""
+
+    def test_bigrams(self):
+        """Test splitting text into bigrams."""
+        assert bigrams("john") == {"jo", "oh", "hn"}
+        assert bigrams("j") == set()
+
+    def test_match_all_and_any(self):
+        """Test substring candidates and shared-bigram candidates."""
+        index = BigramIndex()
+        index.add("1", "john doe")
+        index.add("2", "jane smith")
+        index.add("3", "bob johnson")
+
+        assert index.match_all("john") == {"1", "3"}
+        assert index.match_all("xyz") == set()
+        assert index.match_all("j") is None
+        assert index.match_any("jane") == {"2"}
+
+    def test_replace_and_remove(self):
+        """Test that re-adding keeps order and removing drops postings."""
+        index = BigramIndex()
+        index.add("1", "john doe")
+        index.add("2", "jane smith")
+        index.add("1", "janet parker")
+
+        assert index.match_all("jan") == {"1", "2"}
+        assert index.ordered({"2", "1"}) == ["1", "2"]
+        assert index.match_all("john") == set()
+
+        index.remove("1")
+        assert index.match_all("jan") == {"2"}
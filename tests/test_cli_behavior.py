@@ -74,6 +74,13 @@ class TestCLIBehavior:
         printed_text = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
         assert "Fatal error: Init error" in printed_text
 
+    def test_yes_flag(self):
+        """Test that --yes on the command line turns off confirmations."""
+        with patch("sys.argv", ["kontacto", "--yes"]):
+            with patch("kontacto.main.Kontacto") as mock_app:
+                main()
+        mock_app.assert_called_once_with(assume_yes=True)
+
     def test_command_parsing(self):
         """Test various command parsing scenarios."""
         test_cases = [
@@ -183,6 +190,18 @@ class TestCLIBehavior:
         assert "Unknown command: add-contac" in output
         assert "Did you mean: add-contact?" in output
 
+    def test_help_suggestion_beyond_two_edits(self, app, capsys):
+        """Test that help suggests commands more than two edits away, like the prompt does."""
+        app.process_command("help notes-tag")
+        assert "Did you mean: notes-by-tag?" in capsys.readouterr().out
+
+        app.process_command("search")
+        prompt_output = capsys.readouterr().out
+        app.process_command("help search")
+        help_output = capsys.readouterr().out
+        assert "Did you mean: search-tag?" in prompt_output
+        assert "Did you mean: search-tag?" in help_output
+
     def test_empty_command(self, app):
         """Test that empty commands are handled gracefully."""
         # These should not raise exceptions
@@ -192,15 +211,37 @@ class TestCLIBehavior:
 
     def test_clear_command(self, app):
         """Test clear command functionality."""
-        with patch("os.name", "posix"):
+        with patch("sys.stdout") as mock_stdout:
+            mock_stdout.isatty.return_value = True
+            with patch.dict("os.environ", {"TERM": "xterm-256color"}):
+                with patch("os.system") as mock_system:
+                    app.process_command("clear")
+                    mock_system.assert_not_called()
+            mock_stdout.write.assert_called_once_with("\x1b[H\x1b[2J\x1b[3J")
+
+    def test_clear_command_dumb_terminal(self, app):
+        """Test clear command falls back to the shell on dumb terminals."""
+        with patch("sys.stdout") as mock_stdout:
+            mock_stdout.isatty.return_value = True
+            with patch.dict("os.environ", {"TERM": "dumb"}):
+                with patch("os.name", "posix"):
+                    with patch("os.system") as mock_system:
+                        app.process_command("clear")
+                        mock_system.assert_called_once_with("clear")
+
+                with patch("os.name", "nt"):
+                    with patch("os.system") as mock_system:
+                        app.process_command("cls")
+                        mock_system.assert_called_once_with("cls")
+
+    def test_clear_command_not_a_terminal(self, app):
+        """Test clear command does nothing when output is not a terminal."""
+        with patch("sys.stdout") as mock_stdout:
+            mock_stdout.isatty.return_value = False
             with patch("os.system") as mock_system:
                 app.process_command("clear")
-                mock_system.assert_called_once_with("clear")
-
-        with patch("os.name", "nt"):
-            with patch("os.system") as mock_system:
-                app.process_command("cls")
-                mock_system.assert_called_once_with("cls")
+                mock_system.assert_not_called()
+            mock_stdout.write.assert_not_called()
 
     def test_help_for_specific_command(self, app, capsys):
         """Test help command for specific commands."""
@@ -0,0 +1,164 @@
+import pytest
+
+from kontacto.commands._trie import Trie
+from kontacto.commands.builtin_commands import ClearCommand, ExitCommand, HelpCommand
+from kontacto.commands.command_registry import CommandRegistry
+from kontacto.commands.contact_commands import AddContactCommand, ListContactsCommand
+from kontacto.commands.note_commands import AddNoteCommand, ListNotesCommand
+from kontacto.commands.tag_commands import ListTagsCommand
+
+
+class TestTrie:
+    """Test cases for the command name trie."""
+
+    def test_complete(self):
+        """Test prefix completion."""
+        trie = Trie()
+        for word in ["add-contact", "add-note", "ac", "list-notes"]:
+            trie.insert(word)
+
+        assert trie.complete("add") == ["add-contact", "add-note"]
+        assert trie.complete("a") == ["ac", "add-contact", "add-note"]
+        assert trie.complete("x") == []
+
+    def test_approx(self):
+        """Test approximate matching by edit distance."""
+        trie = Trie()
+        for word in ["help", "exit", "clear"]:
+            trie.insert(word)
+
+        assert trie.approx("hlep", 2) == [("help", 2)]
+        assert trie.approx("exti", 2) == [("exit", 2)]
+        assert trie.approx("clea", 1) == [("clear", 1)]
+        assert trie.approx("zzzzzz", 2) == []
+
+
+class TestCommandRegistry:
+    """Test cases for the command registry."""
+
+    @pytest.fixture
+    def registry(self):
+        """Create a registry with a few commands."""
+        registry = CommandRegistry()
+        for command in [AddContactCommand(), ListContactsCommand(), AddNoteCommand(), ListTagsCommand()]:
+            registry.register(command)
+        for command in [HelpCommand(), ExitCommand(), ClearCommand()]:
+            registry.register(command)
+        return registry
+
+    def test_get_by_name_and_alias(self, registry):
+        """Test resolving commands by name and alias."""
+        command = registry.get("add-contact")
+        assert command is not None
+        assert registry.get("ac") is command
+        assert registry.get("missing") is None
+
+    def test_alias_map(self, registry):
+        """Test that names and aliases resolve to canonical names."""
+        alias_map = registry.get_alias_map()
+        assert alias_map["ac"] == "add-contact"
+        assert alias_map["add-contact"] == "add-contact"
+        assert "missing" not in alias_map
+
+        with pytest.raises(TypeError):
+            alias_map["missing"] = "help"
+
+        registry.register(ListNotesCommand())
+        assert alias_map["ln"] == "list-notes"
+
+    def test_duplicate_registration(self, registry):
+        """Test that duplicate names and aliases are rejected."""
+        with pytest.raises(ValueError):
+            registry.register(AddContactCommand())
+
+    def test_duplicate_alias_leaves_registry_unchanged(self, registry):
+        """Test that a rejected alias does not register any part of the command."""
+        command = ClearCommand()
+        command.name = "clean"
+        command.aliases = ["cln", "exit"]
+        commands, names = registry.get_all_commands(), registry.get_command_names()
+
+        with pytest.raises(ValueError, match="Alias 'exit' already registered"):
+            registry.register(command)
+
+        assert registry.get("clean") is None
+        assert registry.get("cln") is None
+        assert "clean" not in registry.get_alias_map()
+        assert registry.complete("clea") == ["clear"]
+        assert registry.get_all_commands() == commands
+        assert registry.get_command_names() == names
+
+    def test_command_names_sorted(self, registry):
+        """Test that names and aliases are returned sorted."""
+        names = registry.get_command_names()
+        assert list(names) == sorted(names)
+        assert "ac" in names
+        assert "add-contact" in names
+
+    def test_categorized(self, registry):
+        """Test grouping commands by help category."""
+        categorized = registry.get_categorized()
+
+        assert [cmd.name for cmd in categorized["contact"]] == ["add-contact", "list-contacts"]
+        assert [cmd.name for cmd in categorized["note"]] == ["add-note"]
+        assert [cmd.name for cmd in categorized["tag"]] == ["list-tags"]
+        assert [cmd.name for cmd in categorized["other"]] == ["clear", "exit", "help"]
+
+    def test_complete_and_approx(self, registry):
+        """Test prefix completion and typo suggestions."""
+        assert registry.complete("list-") == ["list-contacts", "list-tags"]
+        assert registry.approx("add-contac", 2)[0] == "add-contact"
+
+    def test_suggest(self, registry):
+        """Test suggestions within two edits and fuzzy fallback beyond them."""
+        assert registry.suggest("ADD-CONTAC") == "add-contact"
+        assert registry.suggest("contacts-list") == "contacts"
+        assert registry.suggest("zzzzzzzz") is None
+
+
+class TestBaseCommandFinalize:
+    """Test cases for automatic precomputation of command metadata."""
+
+    def test_subclass_chain_finalizes_once(self):
+        """Test that a constructor chain finalizes once, with the final metadata."""
+        from kontacto.commands.base_command import BaseCommand
+
+        calls = []
+
+        class ParentCommand(BaseCommand):
+            __slots__ = ()
+
+            def __init__(self):
+                super().__init__()
+                self.name = "parent"
+
+            def _finalize(self):
+                calls.append(self.name)
+                super()._finalize()
+
+        class ChildCommand(ParentCommand):
+            __slots__ = ()
+
+            def __init__(self):
+                super().__init__()
+                self.name = "child"
+                self.aliases = ["c"]
+
+        command = ChildCommand()
+
+        assert calls == ["child"]
+        assert command.matches("c")
+        assert not command.matches("parent")
+        assert command.alias_suffix == " (c)"
+        assert "\nchild (aliases: c)\n-----\n" in command.get_help()
+
+    def test_rest(self):
+        """Test joining trailing arguments."""
+        from kontacto.commands.base_command import BaseCommand
+
+        single = "John"
+        assert BaseCommand._rest([single]) is single
+        assert BaseCommand._rest(["John", "Doe"]) == "John Doe"
+        assert BaseCommand._rest(["edit", "address", "1 Main St"], 1) == "address 1 Main St"
+        assert BaseCommand._rest(["edit"], 1) == ""
+        assert BaseCommand._rest([]) == ""
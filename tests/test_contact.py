@@ -1,3 +1,4 @@
+import pickle
 from datetime import date
 
 import pytest
@@ -110,3 +111,71 @@ class TestContact:
         assert contact2.emails == contact1.emails
         assert contact2.birthday == contact1.birthday
         assert contact2.id == contact1.id
+
+    def test_table_row_cache(self):
+        """Test that the cached table row follows contact changes."""
+        contact = Contact(name="Row Test")
+        assert contact.table_row() == ("Row Test", "N/A", "N/A", "N/A", "N/A")
+        assert contact.table_row() is contact.table_row()
+
+        contact.add_phone("555-123-4567")
+        contact.address = "1 Main St"
+        contact.birthday = date(1990, 4, 15)
+
+        row = contact.table_row()
+        assert row[1] == "1 Main St"
+        assert row[2] == contact.phones[0]
+        assert row[4] == "1990-04-15"
+
+    def test_month_day(self):
+        """Test the birthday (month, day) accessor."""
+        contact = Contact(name="Month Day")
+        assert contact.month_day is None
+
+        contact.birthday = date(1990, 4, 15)
+        assert contact.month_day == (4, 15)
+
+    def test_display_strings(self):
+        """Test the cached display strings for phones, emails and birthday."""
+        contact = Contact(name="Display Test")
+        assert contact.phones_str == ""
+        assert contact.emails_str == ""
+        assert contact.birthday_str == ""
+
+        contact.add_phone("0501234567")
+        contact.add_phone("0671234567")
+        contact.add_email("test@example.com")
+        contact.birthday = date(1990, 4, 15)
+
+        assert contact.phones_str == "0501234567, 0671234567"
+        assert contact.emails_str == "test@example.com"
+        assert contact.birthday_str == "1990-04-15"
+
+        contact.remove_phone("0501234567")
+        assert contact.phones_str == "0671234567"
+
+    def test_search_blob_follows_changes(self):
+        """Test that search matching stays within fields and follows edits."""
+        contact = Contact(name="Ann", address="Bay St")
+        assert not contact.matches_search("annbay")
+        assert not contact.matches_search("ann bay")
+
+        contact.add_email("ann@example.com")
+        assert contact.matches_search("EXAMPLE")
+
+        contact.address = "Elm St"
+        assert not contact.matches_search("bay")
+
+    def test_pickle_round_trip(self):
+        """Test pickling slotted contacts and restoring pre-slots state."""
+        contact = Contact(name="Pickled", address="1 Main St", birthday=date(1990, 4, 15))
+        contact.add_phone("0501234567")
+        contact.table_row()
+
+        restored = pickle.loads(pickle.dumps(contact))
+        assert restored.to_dict() == contact.to_dict()
+        assert "_row_cache" not in contact.__getstate__()
+
+        legacy = Contact.__new__(Contact)
+        legacy.__setstate__({**contact.__getstate__(), "_row_cache": ("stale",)})
+        assert legacy.table_row()[0] == "Pickled"
@@ -0,0 +1,130 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from kontacto.commands.contact_commands import EditContactCommand
+from kontacto.models.contact import Contact
+from kontacto.repositories.contact_repository import ContactRepository
+
+
+class TestContactRepository:
+    """Test cases for the contact repository."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create a repository with a few contacts."""
+        repo = ContactRepository(str(tmp_path / "contacts.pkl"))
+        for name in ["John Doe", "Jane Smith", "Bob Johnson"]:
+            repo.add(Contact(name))
+        return repo
+
+    def test_search_substring(self, repo):
+        """Test that substring matches are returned in insertion order."""
+        assert [c.name for c in repo.search("jo")] == ["John Doe", "Bob Johnson"]
+
+    def test_search_fuzzy(self, repo):
+        """Test that typos and reordered tokens still match."""
+        assert [c.name for c in repo.search("Jhon Doe")] == ["John Doe"]
+        assert [c.name for c in repo.search("doe john")] == ["John Doe"]
+        assert repo.search("xyz") == []
+
+    def test_search_after_failed_replace_phone(self, repo):
+        """Test that a rejected replace-phone keeps the contact and its search results intact."""
+        contact = repo.get_by_name("John Doe")
+        contact.add_phone("0501234567")
+        repo.update(contact)
+        assert repo.search("0501234567") == [contact]
+
+        with patch("builtins.print"):
+            EditContactCommand()._direct_edit(contact, ["replace-phone", "0501234567 12"], repo)
+
+        assert contact.phones == ["0501234567"]
+        assert repo.search("0501234567") == [contact]
+
+        contact.remove_phone("0501234567")
+        repo.refresh(contact)
+        assert repo.search("0501234567") == []
+
+    def test_search_after_changes(self, repo):
+        """Test that the search cache follows adds, updates and deletes."""
+        contact = repo.get_by_name("Jane Smith")
+        contact.name = "Janet Parker"
+        repo.update(contact)
+        repo.add(Contact("Alice Cooper"))
+
+        assert [c.name for c in repo.search("Janet Parkr")] == ["Janet Parker"]
+        assert [c.name for c in repo.search("coper")] == ["Alice Cooper"]
+
+        repo.delete(contact.id)
+        assert repo.search("Janet Parkr") == []
+
+    def test_add_many(self, repo, tmp_path):
+        """Test batch insertion and duplicate rejection."""
+        repo.add_many([Contact("Alice Cooper"), Contact("Carol White")])
+
+        assert repo.count() == 5
+        assert ContactRepository(str(tmp_path / "contacts.pkl")).count() == 5
+
+        duplicate = Contact("Dave Brown")
+        with pytest.raises(ValueError):
+            repo.add_many([duplicate, duplicate])
+        assert repo.count() == 5
+
+    def test_search_phone_and_birthday(self, repo):
+        """Test that phone and birthday substrings are found through the index."""
+        contact = repo.get_by_name("Bob Johnson")
+        contact.add_phone("0501234567")
+        contact.birthday = date(1990, 4, 15)
+        repo.update(contact)
+
+        assert repo.search("1234") == [contact]
+        assert repo.search("1990-04") == [contact]
+        assert repo.get(contact.id) is contact
+
+    def test_clear(self, repo, tmp_path):
+        """Test that clearing drops contacts, indexes and saved data."""
+        repo.clear()
+
+        assert len(repo) == 0
+        assert repo.search("john") == []
+        assert ContactRepository(str(tmp_path / "contacts.pkl")).count() == 0
+
+    def test_read_caches(self, repo):
+        """Test that cached reads return fresh lists and follow writes."""
+        results = repo.search("john")
+        results.clear()
+        assert len(repo.search("john")) == 2
+
+        assert repo.get_by_name("ALICE COOPER") is None
+        alice = Contact("Alice Cooper")
+        repo.add(alice)
+        assert repo.get_by_name("ALICE COOPER") is alice
+
+        repo.delete(alice.id)
+        assert repo.get_by_name("alice cooper") is None
+
+    def test_upcoming_birthdays(self, repo):
+        """Test birthday lookups through the (month, day) index."""
+        today = date.today()
+        for name, offset in [("Bob Johnson", 5), ("John Doe", 1)]:
+            contact = repo.get_by_name(name)
+            upcoming = today + timedelta(days=offset)
+            contact.birthday = date(2000, upcoming.month, upcoming.day)
+            repo.update(contact)
+
+        assert [(c.name, d) for c, d in repo.get_upcoming_birthdays_with_days(7)] == [
+            ("John Doe", 1),
+            ("Bob Johnson", 5),
+        ]
+        assert [c.name for c in repo.get_upcoming_birthdays(3)] == ["John Doe"]
+
+        contact = repo.get_by_name("John Doe")
+        contact.birthday = None
+        repo.update(contact)
+        assert [c.name for c in repo.get_upcoming_birthdays(7)] == ["Bob Johnson"]
+
+    def test_iter_all(self, repo):
+        """Test iterating over contacts without a copy."""
+        assert [c.name for c in repo.iter_all()] == ["John Doe", "Jane Smith", "Bob Johnson"]
+        assert len(repo) == repo.count() == 3
@@ -1,8 +1,10 @@
+from datetime import date, timedelta
 from unittest.mock import patch
 
 import pytest
 
 from kontacto.main import Kontacto
+from kontacto.repositories.contact_repository import birthday_window
 
 
 class TestContactRepository:
@@ -52,10 +54,32 @@ class TestContactRepository:
         # In a real implementation, this would save to persistence
         return contact
 
+    def refresh(self, contact):
+        """Re-index a contact changed in place."""
+        return contact
+
     def get_upcoming_birthdays(self, days=7):
         """Get contacts with upcoming birthdays."""
         return []  # Simplified for testing
 
+    def get_upcoming_birthdays_with_days(self, days=7):
+        """Get contacts with upcoming birthdays and the days left."""
+        window = birthday_window(days)
+        results = [(c, window[c.month_day]) for c in self._contacts if c.month_day in window]
+        return sorted(results, key=lambda result: result[1])
+
+    def count(self):
+        """Get the number of contacts."""
+        return len(self._contacts)
+
+    def iter_all(self):
+        """Iterate over all contacts."""
+        return iter(self._contacts)
+
+    def clear(self):
+        """Delete all contacts."""
+        self._contacts.clear()
+
 
 class TestNoteRepository:
     """Mock repository for testing."""
@@ -73,14 +97,22 @@ class TestNoteRepository:
     def get_all(self):
         return self._notes
 
-    def search(self, query):
+    def count(self):
+        """Get the number of notes."""
+        return len(self._notes)
+
+    def iter_all(self):
+        """Iterate over all notes."""
+        return iter(self._notes)
+
+    def search(self, query, limit=None):
         """Search notes by content."""
         results = []
         query_lower = query.lower()
         for note in self._notes:
             if query_lower in note.content.lower():
                 results.append(note)
-        return results
+        return results[:limit]
 
     def search_by_tag(self, tag):
         """Search notes by tag."""
@@ -97,6 +129,10 @@ class TestNoteRepository:
             tags.update(note.tags)
         return sorted(list(tags))
 
+    def get_tag_counts(self):
+        """Count notes per tag."""
+        return {tag: self.count_by_tag(tag) for tag in self.get_all_tags()}
+
     def get_notes_by_tags(self):
         """Get notes grouped by tags."""
         grouped = {}
@@ -107,11 +143,12 @@ class TestNoteRepository:
                 grouped[tag].append(note)
         return grouped
 
-    def delete(self, note):
-        """Delete a note."""
-        if note in self._notes:
-            self._notes.remove(note)
-            return True
+    def delete(self, note_id):
+        """Delete a note by ID."""
+        for note in self._notes:
+            if note.id == note_id:
+                self._notes.remove(note)
+                return True
         return False
 
     def update(self, note):
@@ -127,6 +164,23 @@ class TestNoteRepository:
                 count += 1
         return count
 
+    def clear(self):
+        """Delete all notes."""
+        self._notes.clear()
+
+    def add_tag_to(self, note, tag):
+        """Add a tag to a note."""
+        return note.add_tag(tag)
+
+    def remove_tag_from(self, note, tag):
+        """Remove a tag from a note."""
+        note.remove_tag(tag)
+
+    def clear_all_tags(self):
+        """Remove all tags from every note."""
+        for note in self._notes:
+            note.clear_tags()
+
 
 class TestIntegration:
     """Integration tests for the complete workflow."""
@@ -172,6 +226,276 @@ class TestIntegration:
             output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
             assert "5551234567" in output  # Phone numbers are displayed without dashes
 
+    def test_list_contacts_pagination(self, app):
+        """Test paging through contacts with --page and --limit."""
+        for i in range(5):
+            app.process_command(f'add-contact "Person {i}"')
+
+        with patch("builtins.print") as mock_print:
+            app.process_command("list-contacts --limit=2 --page=2")
+            output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+            assert "Person 2" in output
+            assert "Person 3" in output
+            assert "Person 1" not in output
+            assert "Person 4" not in output
+            assert "Showing 3-4 of 5" in output
+            assert "--page=3" in output
+
+        with patch("builtins.print") as mock_print:
+            app.process_command("list-contacts --page 4 --limit 2")
+            output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+            assert "Page 4 is empty" in output
+
+        with patch("builtins.print") as mock_print:
+            app.process_command("list-contacts --limit=0")
+            output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+            assert "--limit requires a positive number" in output
+
+    def test_upcoming_birthdays(self, app):
+        """Test listing contacts with birthdays in the next N days."""
+        upcoming = date.today() + timedelta(days=3)
+        app.process_command(f'add-contact "Soon" --birthday={upcoming.day:02d}.{upcoming.month:02d}.2000')
+        app.process_command('add-contact "No Birthday"')
+
+        with patch("builtins.print") as mock_print:
+            app.process_command("birthdays 7")
+            output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+            assert "Soon" in output
+            assert "3 days" in output
+            assert "No Birthday" not in output
+
+        with patch("builtins.print") as mock_print:
+            app.process_command("birthdays 2")
+            output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+            assert "No contacts with birthdays" in output
+
+    def test_leap_day_birthday_in_common_year(self, app):
+        """Test that February 29 birthdays are shown on February 28 in common years."""
+        app.process_command('add-contact "Leap" --birthday=29.02.2000')
+
+        with patch("kontacto.repositories.contact_repository.date") as mock_date:
+            mock_date.today.return_value = date(2025, 2, 27)
+            with patch("builtins.print") as mock_print:
+                app.process_command("birthdays 1")
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "Leap" in output
+                assert "1 days" in output
+
+    def test_add_contact_flag_errors(self, app):
+        """Test error messages for malformed add-contact flags."""
+        cases = [
+            ('add-contact "John" --nickname=jd', "Unknown flag: --nickname"),
+            ('add-contact "John" --phone', "Flag --phone requires a value"),
+            ('add-contact "John" --email=john@example.com --', "Flag -- requires a value"),
+            ('add-contact "John" -- x', "Unknown flag: --"),
+            ('add-contact "John" -x', "Invalid argument: -x"),
+            ('add-contact "John" extra', "Invalid argument: extra"),
+            ('add-contact "John" --bday=1990-04-15', "Invalid birthday format: 1990-04-15"),
+        ]
+        for command, message in cases:
+            with patch("builtins.print") as mock_print:
+                app.process_command(command)
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert message in output
+                assert "added successfully" not in output
+
+        with patch("builtins.print") as mock_print:
+            app.process_command('add-contact "John" --addr "1 Main St" --email=john@example.com --email jd@example.com')
+            output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+            assert "added successfully" in output
+
+        contact = app.contact_repo.get_by_name("John")
+        assert contact.address == "1 Main St"
+        assert contact.emails == ["john@example.com", "jd@example.com"]
+
+    def test_add_contact_dash_prefixed_values(self, app):
+        """Test that the token after a flag is its value even when it starts with a dash."""
+        with patch("builtins.print") as mock_print:
+            app.process_command('add-contact "Dash" --address -x --bd 01.02.2000')
+            output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+            assert "added successfully" in output
+
+        contact = app.contact_repo.get_by_name("Dash")
+        assert contact.address == "-x"
+        assert contact.birthday == date(2000, 2, 1)
+
+    def test_clean_contacts(self, app):
+        """Test deleting all contacts with and without confirmation."""
+        with patch("builtins.print") as mock_print:
+            app.process_command("clean-contacts")
+            output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+            assert "No contacts to delete" in output
+
+        app.process_command('add-contact "John Doe"')
+        app.process_command('add-contact "Jane Smith"')
+
+        with patch("kontacto.ui.console.Console.confirm", return_value=False):
+            app.process_command("clean-contacts")
+        assert app.contact_repo.count() == 2
+
+        with patch("kontacto.ui.console.Console.confirm", return_value=True):
+            with patch("builtins.print") as mock_print:
+                app.process_command("clean-contacts")
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "All contacts deleted successfully" in output
+        assert app.contact_repo.count() == 0
+
+    def test_interactive_edit_multiple_changes(self, app):
+        """Test making several changes in one interactive edit session."""
+        app.process_command('add-contact "John Doe"')
+
+        answers = ["2", "1 Main St", "y", "4", "0501234567", "n"]
+        with patch("kontacto.ui.console.Console.prompt", side_effect=answers):
+            with patch("builtins.print") as mock_print:
+                app.process_command('edit-contact "John Doe"')
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert output.count("updated successfully") == 2
+
+        contact = app.contact_repo.get_by_name("John Doe")
+        assert contact.address == "1 Main St"
+        assert contact.phones == ["0501234567"]
+
+    def test_direct_edit_fields(self, app):
+        """Test direct-mode edits dispatched by field name."""
+        app.process_command('add-contact "John Doe" --phone=0501234567')
+
+        app.process_command('edit-contact "John Doe" address "1 Main St"')
+        app.process_command('edit-contact "John Doe" remove-phone 0501234567')
+        app.process_command('edit-contact "John Doe" name "Johnny Doe"')
+
+        contact = app.contact_repo.get_by_name("Johnny Doe")
+        assert contact.address == "1 Main St"
+        assert contact.phones == []
+
+        with patch("builtins.print") as mock_print:
+            app.process_command('edit-contact "Johnny Doe" nickname JD')
+            output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+            assert "Unknown field: nickname" in output
+
+    def test_list_and_search_notes_limits(self, app):
+        """Test that long note listings are cut with a footer."""
+        with patch("builtins.print"):
+            for content in ["Buy milk", "Buy bread", "Buy eggs"]:
+                app.process_command(f'add-note "{content}"')
+
+        with patch("kontacto.commands.note_commands.LIST_LIMIT", 2):
+            with patch("builtins.print") as mock_print:
+                app.process_command("list-notes")
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "Total notes: 3" in output
+                assert "Buy bread" in output
+                assert "Buy eggs" not in output
+                assert "Showing 2 of 3" in output
+
+        with patch("kontacto.commands.note_commands.SEARCH_LIMIT", 1):
+            with patch("builtins.print") as mock_print:
+                app.process_command("search-notes buy")
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "Found 3 note(s)" in output
+                assert "Buy bread" not in output
+                assert "Showing 1 of 3" in output
+
+    def test_add_note_duplicate_tags(self, app):
+        """Test that repeated tags are stored and counted once."""
+        with patch("builtins.print") as mock_print:
+            app.process_command('add-note "Buy milk" shopping Shopping " shopping " urgent')
+            output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+            assert "with 2 tag(s)" in output
+        assert app.note_repo.get_all()[0].tags == ["shopping", "urgent"]
+
+    def test_edit_note_selection(self, app):
+        """Test picking one of several matching notes to edit."""
+        with patch("builtins.print"):
+            app.process_command('add-note "Buy milk"')
+            app.process_command('add-note "Buy bread"')
+
+        with patch("kontacto.ui.console.Console.prompt", return_value="2"):
+            with patch("builtins.print") as mock_print:
+                app.process_command('edit-note buy "Buy rye bread"')
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "Found 2 notes matching 'buy'" in output
+                assert "updated successfully" in output
+        assert [note.content for note in app.note_repo.get_all()] == ["Buy milk", "Buy rye bread"]
+
+        with patch("kontacto.ui.console.Console.prompt", return_value="0"):
+            with patch("builtins.print"):
+                app.process_command('edit-note buy "Never mind"')
+        assert [note.content for note in app.note_repo.get_all()] == ["Buy milk", "Buy rye bread"]
+
+    def test_delete_note_many_matches(self, app):
+        """Test that only the first matches are offered when many notes match."""
+        with patch("builtins.print"):
+            for i in range(7):
+                app.process_command(f'add-note "Buy item {i}"')
+
+        with patch("kontacto.ui.console.Console.prompt", return_value="6"):
+            with patch("builtins.print") as mock_print:
+                app.process_command("delete-note buy")
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "Found more than 5 notes matching 'buy'" in output
+                assert "Buy item 4" in output
+                assert "Buy item 5" not in output
+                assert "Invalid selection" in output
+        assert len(app.note_repo.get_all()) == 7
+
+    def test_add_and_remove_tag(self, app):
+        """Test tagging a note interactively."""
+        with patch("builtins.print"):
+            app.process_command('add-note "Buy milk" shopping')
+
+        with patch("kontacto.ui.console.Console.prompt", side_effect=["1", "Urgent"]):
+            with patch("builtins.print") as mock_print:
+                app.process_command("add-tag")
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "1. Buy milk\n   Tags: shopping" in output
+                assert "added successfully" in output
+        assert app.note_repo.get_all_tags() == ["shopping", "urgent"]
+
+        with patch("kontacto.ui.console.Console.prompt", side_effect=["1", "shopping"]):
+            with patch("builtins.print") as mock_print:
+                app.process_command("add-tag")
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "already has tag 'shopping'" in output
+
+        with patch("kontacto.ui.console.Console.prompt", side_effect=["1", "1"]):
+            with patch("builtins.print") as mock_print:
+                app.process_command("remove-tag")
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "'shopping' removed successfully" in output
+        assert app.note_repo.get_all_tags() == ["urgent"]
+
+    def test_clean_tags_and_notes(self, app):
+        """Test removing all tags, then all notes."""
+        with patch("builtins.print"):
+            app.process_command('add-note "Buy milk" shopping')
+            app.process_command('add-note "Meeting at 3pm" work urgent')
+
+        with patch("kontacto.ui.console.Console.confirm", return_value=True):
+            with patch("builtins.print") as mock_print:
+                app.process_command("clean-tags")
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "All tags removed" in output
+            assert app.note_repo.get_all_tags() == []
+            assert len(app.note_repo.get_all()) == 2
+
+            with patch("builtins.print") as mock_print:
+                app.process_command("clean-notes")
+                output = " ".join(str(call[0][0]) for call in mock_print.call_args_list)
+                assert "All notes deleted" in output
+            assert app.note_repo.get_all() == []
+
+    def test_assume_yes_skips_confirmation(self, app):
+        """Test that assume_yes deletes without asking."""
+        app.context["assume_yes"] = True
+        with patch("builtins.print"):
+            app.process_command('add-note "Buy milk"')
+
+        with patch("kontacto.ui.console.Console.confirm") as mock_confirm:
+            with patch("builtins.print"):
+                app.process_command("delete-note milk")
+        mock_confirm.assert_not_called()
+        assert app.note_repo.get_all() == []
+
     def test_full_note_workflow(self, app):
         """Test complete note management workflow."""
         # Add a note
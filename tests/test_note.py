@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from kontacto.models.note import Note
@@ -13,15 +15,18 @@ class TestNote:
 
         assert note.content == "Test note content"
         assert note.tags == []
-        assert note.id is not None
+        assert len(note.id) == 32
+        assert note.id != Note(content="Other note").id
         assert note.created_at is not None
-        assert note.modified_at is not None
+        assert note.modified_at == note.created_at
 
     def test_note_with_tags(self):
         """Test creating a note with tags."""
         tags = ["work", "important", "Project X"]
         note = Note(content="Project deadline", tags=tags)
 
+        assert note.modified_at == note.created_at
+
         # Tags should be normalized
         assert "work" in note.tags
         assert "important" in note.tags
@@ -56,6 +61,56 @@ class TestNote:
         with pytest.raises(ValidationError):
             note.remove_tag("nonexistent")
 
+    def test_search_after_content_change(self):
+        """Test that search follows content changes and restored notes without the cached content."""
+        note = Note(content="Buy MILK")
+        assert note.matches_search("milk")
+
+        note.content = "Call Alice"
+        assert note.matches_search("ALICE")
+        assert not note.matches_search("milk")
+
+        note._content_lower = None
+        assert note.matches_search("alice")
+
+    def test_display_strings(self):
+        """Test cached tag and creation time strings follow changes."""
+        note = Note(content="Shopping list", tags=["work"])
+        assert note.tags_str == "work"
+        assert note.created_str == note.created_at.strftime("%Y-%m-%d %H:%M")
+
+        note.add_tag("Errands")
+        assert note.tags_str == "errands, work"
+        assert note.sorted_tags == ("errands", "work")
+        assert note.sorted_tags is note.sorted_tags
+        note.tags.append("mutated")
+        assert note.tags == ["errands", "work"]
+        note.clear_tags()
+        assert note.tags_str == ""
+
+        note.created_at = note.created_at.replace(year=2001)
+        assert note.created_str.startswith("2001-")
+
+    def test_pickle_skips_caches(self):
+        """Test that pickled notes leave out caches and rebuild them after loading."""
+        note = Note(content="Buy MILK", tags=["shopping"])
+        assert note.tags_str == "shopping"
+        assert note.created_str
+
+        state = note.__getstate__()
+        assert not {"_content_lower", "_tags_str", "_created_cache"} & set(state)
+
+        restored = pickle.loads(pickle.dumps(note))
+        assert restored.matches_search("milk")
+        assert restored.tags_str == "shopping"
+        assert restored.created_str == note.created_str
+
+        assert not hasattr(note, "__dict__")
+        legacy = Note.__new__(Note)
+        legacy.__setstate__({**state, "_tags_str": "stale"})
+        assert legacy.tags_str == "shopping"
+        assert legacy.matches_search("MILK")
+
     def test_tag_normalization(self):
         """Test tag normalization."""
         note = Note(content="Test")
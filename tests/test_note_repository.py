@@ -0,0 +1,131 @@
+import pytest
+
+from kontacto.models.note import Note
+from kontacto.repositories.note_repository import NoteRepository
+
+
+class TestNoteRepository:
+    """Test cases for the note repository."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create a repository with a few notes."""
+        repo = NoteRepository(str(tmp_path / "notes.pkl"))
+        repo.add(Note("Buy milk and bread", ["shopping"]))
+        repo.add(Note("Project deadline next week", ["work", "important"]))
+        repo.add(Note("Call the bakery about bread", ["Errands"]))
+        return repo
+
+    def test_search(self, repo):
+        """Test substring search over content and tags, in insertion order."""
+        assert [n.content for n in repo.search("BREAD")] == ["Buy milk and bread", "Call the bakery about bread"]
+        assert [n.content for n in repo.search("import")] == ["Project deadline next week"]
+        assert len(repo.search("e")) == 3
+        assert repo.search("xyz") == []
+
+    def test_search_limit(self, repo):
+        """Test that limited searches return the first matches only."""
+        assert [n.content for n in repo.search("e", limit=2)] == [
+            "Buy milk and bread",
+            "Project deadline next week",
+        ]
+        assert len(repo.search("e", limit=10)) == 3
+        assert repo.search("xyz", limit=2) == []
+
+    def test_search_cache(self, repo):
+        """Test that cached searches return fresh lists and follow writes."""
+        results = repo.search("Bread")
+        results.clear()
+        assert len(repo.search("bread")) == 2
+
+        repo.add(Note("Bread recipe"))
+        assert len(repo.search("bread")) == 3
+
+        repo.clear()
+        assert repo.search("bread") == []
+
+    def test_search_by_tag(self, repo):
+        """Test tag lookups with tag normalization."""
+        assert [n.content for n in repo.search_by_tag("ERRANDS")] == ["Call the bakery about bread"]
+        assert repo.search_by_tag("missing") == []
+
+    def test_index_follows_changes(self, repo):
+        """Test that the indexes follow updates and deletes."""
+        note = repo.search("milk")[0]
+        note.content = "Buy oat milk"
+        note.remove_tag("shopping")
+        note.add_tag("groceries")
+        repo.update(note)
+
+        assert repo.search("bread") == [repo.search("bakery")[0]]
+        assert repo.search_by_tag("shopping") == []
+        assert repo.search_by_tag("groceries") == [note]
+        assert repo.get(note.id) is note
+
+        repo.delete(note.id)
+        assert repo.search("oat") == []
+        assert repo.search_by_tag("groceries") == []
+        assert repo.get(note.id) is None
+
+    def test_tag_queries(self, repo):
+        """Test tag listing, counting and grouping from the tag index."""
+        extra = Note("Review the quarterly report", ["work"])
+        repo.add(extra)
+
+        assert repo.get_all_tags() == ["errands", "important", "shopping", "work"]
+        assert repo.count_by_tag("Work") == 2
+        assert repo.count_by_tag("missing") == 0
+        assert repo.get_tag_counts() == {"errands": 1, "important": 1, "shopping": 1, "work": 2}
+
+        grouped = repo.get_notes_by_tags()
+        assert list(grouped) == ["errands", "important", "shopping", "work"]
+        assert [n.content for n in grouped["work"]] == ["Project deadline next week", "Review the quarterly report"]
+
+    def test_add_and_remove_tag(self, repo, tmp_path):
+        """Test tagging stored notes through the repository."""
+        note = repo.search("milk")[0]
+        assert repo.add_tag_to(note, "Urgent")
+        modified_at = note.modified_at
+        assert not repo.add_tag_to(note, "urgent")
+        assert note.modified_at == modified_at
+        repo.remove_tag_from(note, "shopping")
+
+        assert repo.search_by_tag("urgent") == [note]
+        assert repo.search_by_tag("shopping") == []
+        assert NoteRepository(str(tmp_path / "notes.pkl")).get(note.id).tags == ["urgent"]
+
+        with pytest.raises(ValueError):
+            repo.add_tag_to(Note("Not stored"), "urgent")
+
+    def test_clear_all_tags(self, repo, tmp_path):
+        """Test removing every tag with a single save."""
+        repo.clear_all_tags()
+
+        assert repo.get_all_tags() == []
+        assert repo.search("import") == []
+        assert repo.count() == 3
+        assert NoteRepository(str(tmp_path / "notes.pkl")).get_all_tags() == []
+
+    def test_add_many(self, repo, tmp_path):
+        """Test batch insertion and duplicate rejection."""
+        repo.add_many([Note("Water the plants", ["home"]), Note("Pay rent", ["home"])])
+
+        assert repo.count() == 5
+        assert len(repo.search_by_tag("home")) == 2
+        assert NoteRepository(str(tmp_path / "notes.pkl")).count() == 5
+
+        duplicate = Note("Walk the dog")
+        with pytest.raises(ValueError):
+            repo.add_many([duplicate, duplicate])
+        assert repo.count() == 5
+
+    def test_reload_and_clear(self, repo, tmp_path):
+        """Test that indexes are rebuilt on load and dropped by clear()."""
+        reloaded = NoteRepository(str(tmp_path / "notes.pkl"))
+        assert len(reloaded.search("bread")) == 2
+        assert len(reloaded.search_by_tag("work")) == 1
+
+        repo.clear()
+        assert repo.search("bread") == []
+        assert repo.search_by_tag("work") == []
+        assert NoteRepository(str(tmp_path / "notes.pkl")).count() == 0
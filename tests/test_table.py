@@ -0,0 +1,26 @@
+from tabulate import tabulate
+
+from kontacto.ui.table import render_grid
+
+
+class TestRenderGrid:
+    """Test cases for the grid table renderer."""
+
+    def test_matches_tabulate_grid(self):
+        """Test that output is identical to tabulate's grid format for text cells."""
+        headers = ["Name", "Address", "Phones"]
+        rows = [("John Doe", "N/A", "0501234567, 0671234567"), ("Al", "1 Main St", "N/A")]
+
+        assert render_grid(headers, rows) == tabulate(rows, headers=headers, tablefmt="grid", disable_numparse=True)
+
+    def test_empty_rows(self):
+        """Test rendering a table with headers only."""
+        headers = ["Name", "Birthday"]
+
+        assert render_grid(headers, []) == tabulate([], headers=headers, tablefmt="grid")
+
+    def test_cells_kept_verbatim(self):
+        """Test that numeric-looking and non-string cells are shown as given."""
+        table = render_grid(["Phone", "Count"], iter([("0501234567", 3)]))
+
+        assert "| 0501234567 | 3       |" in table
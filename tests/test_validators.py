@@ -2,7 +2,14 @@ from datetime import date
 
 import pytest
 
-from kontacto.utils.validators import ValidationError, parse_date, validate_birthday, validate_email, validate_phone
+from kontacto.utils.validators import (
+    ValidationError,
+    parse_date,
+    parse_dmy_date,
+    validate_birthday,
+    validate_email,
+    validate_phone,
+)
 
 
 class TestValidatePhone:
@@ -209,6 +216,22 @@ class TestParseDate:
         assert parse_date("invalid") is None
         assert parse_date("") is None
         assert parse_date("2023-13-01") is None
+        assert parse_date("31.02.2023") is None
+
+    def test_parse_date_fast_paths(self):
+        """Test that ISO and DD.MM.YYYY dates parse to the expected values."""
+        assert parse_date("2023-12-25") == date(2023, 12, 25)
+        assert parse_date("25.12.2023") == date(2023, 12, 25)
+        assert parse_date("5.1.2023") == date(2023, 1, 5)
+        assert parse_date("20231225") is None
+
+    def test_parse_dmy_date(self):
+        """Test strict DD.MM.YYYY parsing."""
+        assert parse_dmy_date("25.12.2023") == date(2023, 12, 25)
+        assert parse_dmy_date("5.1.2023") == date(2023, 1, 5)
+        for invalid in ("31.02.2023", "2023-12-25", "25/12/2023"):
+            with pytest.raises(ValueError):
+                parse_dmy_date(invalid)
 
 
 class TestValidationError: